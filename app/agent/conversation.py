@@ -12,7 +12,7 @@ import logging
 from collections import defaultdict
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
@@ -568,6 +568,9 @@ Do not include any markdown, code blocks, or text outside the JSON object."""
             # Check user availability
             user_available = await self._check_user_availability()
             
+            # One clock reading for every task scored in this turn
+            now = datetime.now(timezone.utc)
+            
             for result in tool_results:
                 if not result.get("success"):
                     continue
@@ -578,8 +581,8 @@ Do not include any markdown, code blocks, or text outside the JSON object."""
                 # Process PR context
                 if tool_name == "get_github_pr_context" and isinstance(data, dict):
                     try:
-                        context = extract_task_context_from_pr(data)
-                        decision = decide_action(context, user_available, automation_enabled=False)
+                        context = extract_task_context_from_pr(data, now)
+                        decision = decide_action(context, user_available, automation_enabled=False, now=now)
                         decision_traces.append({
                             "task_type": "pr",
                             "task_id": context.task_id,
@@ -592,8 +595,8 @@ Do not include any markdown, code blocks, or text outside the JSON object."""
                 # Process single Jira issue
                 elif tool_name == "get_jira_issue" and isinstance(data, dict):
                     try:
-                        context = extract_task_context_from_jira(data)
-                        decision = decide_action(context, user_available, automation_enabled=False)
+                        context = extract_task_context_from_jira(data, now)
+                        decision = decide_action(context, user_available, automation_enabled=False, now=now)
                         decision_traces.append({
                             "task_type": "jira_issue",
                             "task_id": context.task_id,
@@ -608,8 +611,8 @@ Do not include any markdown, code blocks, or text outside the JSON object."""
                     try:
                         # Process first issue as example
                         issue = data[0]
-                        context = extract_task_context_from_jira(issue)
-                        decision = decide_action(context, user_available, automation_enabled=False)
+                        context = extract_task_context_from_jira(issue, now)
+                        decision = decide_action(context, user_available, automation_enabled=False, now=now)
                         decision_traces.append({
                             "task_type": "jira_issue",
                             "task_id": context.task_id,
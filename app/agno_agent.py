@@ -6,164 +6,77 @@ Handles Jira and GitHub operations with reasoning capabilities.
 """
 
 import os
+import asyncio
 import logging
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+# Re-exported for existing callers; routing has no Agno dependency
+from app.agno_router import (
+    is_jira_request,
+    is_github_request,
+    is_calendar_request,
+    is_memory_request,
+    should_use_agno
+)
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 logger = logging.getLogger(__name__)
 
 AGNO_AVAILABLE = False
 AGNO_ERROR = None
+_AGNO_IMPORT_ATTEMPTED = False
 
-# Try importing Agno components step by step to identify the issue
-try:
-    logger.info("Attempting to import agno.agent...")
+if TYPE_CHECKING:
     from agno.agent import Agent
-    logger.info("Successfully imported agno.agent")
-    
-    logger.info("Attempting to import agno.models.google...")
     from agno.models.google import Gemini
-    logger.info("Successfully imported agno.models.google")
-
-    logger.info("Attempting to import agno.db.mongo.mongo...")
-    # Import the correct MongoDb class (implements BaseDb)
     from agno.db.mongo.mongo import MongoDb
-    logger.info("Successfully imported agno.db.mongo.mongo")
-    
-    logger.info("Attempting to import Jira tools...")
-    from app.agno_tools.jira_tools import (
-        get_jira_issues_tool,
-        get_jira_issue_tool,
-        get_jira_projects_tool,
-        get_jira_boards_tool,
-        get_jira_board_issues_tool,
-        find_jira_user_tool,
-        create_jira_issue_tool,
-        update_jira_issue_tool
-    )
-    logger.info("Successfully imported all Jira tools")
-    
-    logger.info("Attempting to import GitHub tools...")
-    from app.agno_tools.github_tools import (
-        get_github_pulls_tool,
-        get_github_pull_tool,
-        get_github_pr_context_tool,
-        get_github_pr_checks_tool,
-        get_github_pr_reviews_tool,
-        get_github_commits_tool,
-        get_github_repo_tool,
-        create_github_pr_tool,
-        update_github_pr_tool,
-        update_github_pr_assignees_tool,
-        update_github_pr_labels_tool,
-        request_github_pr_review_tool
-    )
-    logger.info("Successfully imported all GitHub tools")
-    
-    logger.info("Attempting to import Calendar tools...")
-    from app.agno_tools.calendar_tools import (
-        list_calendars_tool,
-        get_calendar_events_tool,
-        get_calendar_availability_tool,
-        get_today_events_tool,
-        get_this_week_availability_tool,
-        create_calendar_event_tool
-    )
-    logger.info("Successfully imported all Calendar tools")
-    AGNO_AVAILABLE = True
-except ImportError as e:
-    AGNO_ERROR = f"Import error: {str(e)}"
-    logger.error(f"Agno import failed: {e}", exc_info=True)
-except Exception as e:
-    AGNO_ERROR = f"Unexpected error: {str(e)}"
-    logger.error(f"Agno initialization error: {e}", exc_info=True)
+    from app.agno_tools import jira_tools, github_tools, calendar_tools, batch_tools
 
 
-class AgnoAgent:
-    """Agno-based agent for handling Jira, GitHub, and Calendar operations with reasoning."""
+def _lazy_import() -> bool:
+    """
+    Import Agno and our tool wrappers on first use.
     
-    def __init__(self):
-        """Initialize Agno agent with Jira, GitHub, and Calendar tools."""
-        if not AGNO_AVAILABLE:
-            error_msg = "Agno framework not available."
-            if AGNO_ERROR:
-                error_msg += f" Error: {AGNO_ERROR}"
-            error_msg += " Run: pip install agno (in your virtual environment)"
-            raise ImportError(error_msg)
-        
-        project_id = os.getenv("GCP_PROJECT_ID", "continuum-ai-482615")
-        location = os.getenv("GCP_LOCATION", "global")
-        
-        # Initialize Gemini model for Agno (via VertexAI)
-        model = Gemini(
-            id="gemini-3-pro-preview",
-            vertexai=True,
-            project_id=project_id,
-            location=location
-        )
-        
-        # Initialize MongoDB Storage
-        mongo_url = os.getenv("MONGODB_URL")
-        db = None
-        if mongo_url:
-            try:
-                # Initialize MongoDb for both sessions and memories
-                db = MongoDb(
-                    db_url=mongo_url,
-                    db_name="continuum", 
-                    session_collection="sessions",
-                    memory_collection="agent_memory"
-                )
-                logger.info("MongoDB storage initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize MongoDB storage: {e}")
-        else:
-            logger.warning("MONGODB_URL not set, memory persistence disabled")
-
-        # Create agent with Jira, GitHub, and Calendar tools (as functions)
-        self.agent = Agent(
-            model=model,
-            db=db,  # Use 'db' parameter for BaseDb implementation
-            add_history_to_context=True,
-            # Enabling memory as requested
-            enable_user_memories=True, 
-            tools=[
-                # Jira tools
-                get_jira_issues_tool,
-                get_jira_issue_tool,
-                get_jira_projects_tool,
-                get_jira_boards_tool,
-                get_jira_board_issues_tool,
-                find_jira_user_tool,
-                create_jira_issue_tool,
-                update_jira_issue_tool,
-                # GitHub tools
-                get_github_pulls_tool,
-                get_github_pull_tool,
-                get_github_pr_context_tool,
-                get_github_pr_checks_tool,
-                get_github_pr_reviews_tool,
-                get_github_commits_tool,
-                get_github_repo_tool,
-                create_github_pr_tool,
-                update_github_pr_tool,
-                update_github_pr_assignees_tool,
-                update_github_pr_labels_tool,
-                request_github_pr_review_tool,
-                # Calendar tools
-                list_calendars_tool,
-                get_calendar_events_tool,
-                get_calendar_availability_tool,
-                get_today_events_tool,
-                get_this_week_availability_tool,
-                create_calendar_event_tool
-            ],
-            markdown=True,
-            instructions="""You are continuum.ai, a context-aware AI productivity agent for Jira, GitHub, and Calendar task management.
+    Importing this module stays cheap; the framework is only loaded when an
+    agent is built. Any failure disables Agno.
+    
+    Returns:
+        AGNO_AVAILABLE
+    """
+    global AGNO_AVAILABLE, AGNO_ERROR, _AGNO_IMPORT_ATTEMPTED
+    global Agent, Gemini, MongoDb, jira_tools, github_tools, calendar_tools, batch_tools
+    if _AGNO_IMPORT_ATTEMPTED:
+        return AGNO_AVAILABLE
+    _AGNO_IMPORT_ATTEMPTED = True
+    
+    try:
+        from agno.agent import Agent
+        from agno.models.google import Gemini
+        # Import the correct MongoDb class (implements BaseDb)
+        from agno.db.mongo.mongo import MongoDb
+        from app.agno_tools import jira_tools, github_tools, calendar_tools, batch_tools
+        AGNO_AVAILABLE = True
+    except ImportError as e:
+        AGNO_ERROR = f"Import error: {str(e)}"
+        logger.error(f"Agno import failed: {e}", exc_info=True)
+    except Exception as e:
+        AGNO_ERROR = f"Unexpected error: {str(e)}"
+        logger.error(f"Agno initialization error: {e}", exc_info=True)
+    return AGNO_AVAILABLE
+
+
+GEMINI_MODEL_ID = "gemini-3-pro-preview"
+
+# System prompt shared by every agent. It is sent as the same leading bytes on
+# every request, so Gemini's implicit context caching can serve it from cache;
+# keep per-request details (dates, user info) out of it.
+AGENT_INSTRUCTIONS = """You are continuum.ai, a context-aware AI productivity agent for Jira, GitHub, and Calendar task management.
 
 CRITICAL: Use Slack formatting, NOT Markdown:
 - Use *single asterisk* for bold (NOT **double asterisks**)
@@ -186,6 +99,12 @@ You can execute multiple tools in sequence to complete complex workflows. For ex
 - Use results from previous tools to inform next steps (e.g., use free time slots to schedule calendar events)
 - Link related items (e.g., include PR URL in Jira issue description, mention Jira issue in calendar event)
 
+INDEPENDENT TOOL CALLS:
+- When several tool calls are independent (no call needs another call's output), make them all in a single turn as parallel function calls rather than one call per turn
+- Only if you cannot emit parallel calls, wrap them in one batch_tool call instead (a list of {"tool_name": ..., "arguments": {...}} objects); never do both for the same calls
+- Example: "show today's meetings and my open PRs" → call get_today_events_tool and get_github_pulls_tool (state "open") in the same turn
+- Keep dependent steps sequential (e.g., check availability first, then create the event in a free slot)
+
 DELEGATION & RECOMMENDATIONS:
 When users ask "whom should I assign this to?" or similar questions:
 - FIRST: Check your stored memory/context for team member information (GitHub IDs, Jira IDs, skills, expertise)
@@ -260,6 +179,148 @@ REMEMBER:
 - Always offer to take action (create task, assign, etc.) after recommendations
 - Use bullet points with clear labels for reasoning
 - Keep responses scannable and easy to read"""
+
+# Terminal states of a Gemini batch job
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Vertex AI request-type headers per Gemini service tier ("standard" sends none).
+# Priority falls back to Standard automatically when priority quota is exhausted.
+_SERVICE_TIER_HEADERS = {
+    "standard": {},
+    "priority": {
+        "X-Vertex-AI-LLM-Request-Type": "shared",
+        "X-Vertex-AI-LLM-Shared-Request-Type": "priority"
+    },
+    "flex": {
+        "X-Vertex-AI-LLM-Request-Type": "shared",
+        "X-Vertex-AI-LLM-Shared-Request-Type": "flex"
+    },
+}
+
+
+def _build_response_extractor(response) -> Callable[[Any], str]:
+    """Pick how to read text from an agent response; resolved once per response type."""
+    if hasattr(response, 'content'):
+        # Agno returns RunOutput; RunOutput.content is the main response
+        return lambda r: r.content
+    if hasattr(response, 'text'):
+        return lambda r: r.text
+    if hasattr(response, 'response'):
+        # Some Agno versions use response attribute
+        return lambda r: r.response.text if hasattr(r.response, 'text') else str(r.response)
+    if isinstance(response, str):
+        return lambda r: r
+    # Fallback: convert to string
+    return str
+
+
+# Response type -> text extractor, filled on first response of each type
+_RESPONSE_EXTRACTORS: dict[type, Callable[[Any], str]] = {}
+
+
+class AgnoAgent:
+    """Agno-based agent for handling Jira, GitHub, and Calendar operations with reasoning."""
+    
+    def __init__(self, service_tier: Optional[str] = None):
+        """
+        Initialize Agno agent with Jira, GitHub, and Calendar tools.
+        
+        Args:
+            service_tier: Gemini service tier - "priority" (default, for interactive
+                Slack use), "standard", or "flex" (cheaper, for offline jobs).
+                Defaults to the GEMINI_SERVICE_TIER env var.
+        """
+        if not _lazy_import():
+            error_msg = "Agno framework not available."
+            if AGNO_ERROR:
+                error_msg += f" Error: {AGNO_ERROR}"
+            error_msg += " Run: pip install agno (in your virtual environment)"
+            raise ImportError(error_msg)
+        
+        project_id = os.getenv("GCP_PROJECT_ID", "continuum-ai-482615")
+        location = os.getenv("GCP_LOCATION", "global")
+        
+        service_tier = (service_tier or os.getenv("GEMINI_SERVICE_TIER", "priority")).lower()
+        if service_tier not in _SERVICE_TIER_HEADERS:
+            logger.warning("Unknown GEMINI_SERVICE_TIER '%s', using standard", service_tier)
+            service_tier = "standard"
+        self.service_tier = service_tier
+        tier_headers = _SERVICE_TIER_HEADERS[service_tier]
+        
+        # Initialize Gemini model for Agno (via VertexAI)
+        model = Gemini(
+            id=GEMINI_MODEL_ID,
+            vertexai=True,
+            project_id=project_id,
+            location=location,
+            client_params={"http_options": {"headers": tier_headers}} if tier_headers else None
+        )
+        
+        # Initialize MongoDB Storage
+        mongo_url = os.getenv("MONGODB_URL")
+        db = None
+        if mongo_url:
+            try:
+                # Initialize MongoDb for both sessions and memories
+                db = MongoDb(
+                    db_url=mongo_url,
+                    db_name="continuum", 
+                    session_collection="sessions",
+                    memory_collection="agent_memory"
+                )
+                logger.info("MongoDB storage initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize MongoDB storage: {e}")
+        else:
+            logger.warning("MONGODB_URL not set, memory persistence disabled")
+
+        # Create agent with Jira, GitHub, and Calendar tools (as functions)
+        self.agent = Agent(
+            model=model,
+            db=db,  # Use 'db' parameter for BaseDb implementation
+            add_history_to_context=True,
+            # Enabling memory as requested
+            enable_user_memories=True, 
+            tools=[
+                # Jira tools
+                jira_tools.get_jira_issues_tool,
+                jira_tools.get_jira_issue_tool,
+                jira_tools.get_jira_projects_tool,
+                jira_tools.get_jira_boards_tool,
+                jira_tools.get_jira_board_issues_tool,
+                jira_tools.find_jira_user_tool,
+                jira_tools.create_jira_issue_tool,
+                jira_tools.update_jira_issue_tool,
+                # GitHub tools
+                github_tools.get_github_pulls_tool,
+                github_tools.get_github_pull_tool,
+                github_tools.get_github_pr_context_tool,
+                github_tools.get_github_pr_checks_tool,
+                github_tools.get_github_pr_reviews_tool,
+                github_tools.get_github_commits_tool,
+                github_tools.get_github_repo_tool,
+                github_tools.create_github_pr_tool,
+                github_tools.update_github_pr_tool,
+                github_tools.update_github_pr_assignees_tool,
+                github_tools.update_github_pr_labels_tool,
+                github_tools.request_github_pr_review_tool,
+                # Calendar tools
+                calendar_tools.list_calendars_tool,
+                calendar_tools.get_calendar_events_tool,
+                calendar_tools.get_calendar_availability_tool,
+                calendar_tools.get_today_events_tool,
+                calendar_tools.get_this_week_availability_tool,
+                calendar_tools.create_calendar_event_tool,
+                # Concurrent fan-out of independent tool calls
+                batch_tools.batch_tool
+            ],
+            markdown=True,
+            instructions=AGENT_INSTRUCTIONS
         )
         
         logger.info("Agno agent initialized successfully with Jira, GitHub, and Calendar tools")
@@ -280,161 +341,76 @@ REMEMBER:
             # Pass user_id to session_id (if provided) to give each user their own persistent memory
             session_id = user_id if user_id else "default_session"
             
-            logger.info(f"Running Agno agent for user: {user_id} (session: {session_id})")
+            logger.info("Running Agno agent for user: %s (session: %s)", user_id, session_id)
             
             response = await self.agent.arun(message, session_id=session_id)
             
-            # Extract response text - Agno returns RunOutput object
-            if hasattr(response, 'content'):
-                # RunOutput.content is the main response
-                return response.content
-            elif hasattr(response, 'text'):
-                return response.text
-            elif hasattr(response, 'response'):
-                # Some Agno versions use response attribute
-                if hasattr(response.response, 'text'):
-                    return response.response.text
-                return str(response.response)
-            elif isinstance(response, str):
-                return response
-            else:
-                # Fallback: convert to string
-                return str(response)
+            metrics = getattr(response, 'metrics', None)
+            if metrics is not None:
+                logger.debug(
+                    "Gemini tokens: input=%s cached=%s",
+                    getattr(metrics, 'input_tokens', None),
+                    getattr(metrics, 'cache_read_tokens', None)
+                )
+            
+            # Extract response text with the extractor cached for this response type
+            extract = _RESPONSE_EXTRACTORS.get(type(response))
+            if extract is None:
+                extract = _RESPONSE_EXTRACTORS[type(response)] = _build_response_extractor(response)
+            return extract(response)
                 
         except Exception as e:
             logger.error(f"Agno agent error: {e}", exc_info=True)
             raise
 
-
-def is_jira_request(message: str) -> bool:
-    """
-    Determine if a message is a Jira-related request.
-    
-    Args:
-        message: User message
+    async def run_batch(self, messages: list[str], poll_interval: float = 30.0) -> list[str]:
+        """
+        Process independent messages through Gemini Batch Mode.
         
-    Returns:
-        True if message appears to be Jira-related
-    """
-    message_lower = message.lower()
-    
-    # Jira keywords
-    jira_keywords = [
-        "jira", "issue", "task", "board", "project",
-        "assign", "reassign", "create issue", "update issue",
-        "kan-", "proj-", "bug-", "story-", "epic-"
-    ]
-    
-    # Check for Jira issue key pattern (e.g., KAN-2, PROJ-123)
-    import re
-    if re.search(r'[A-Z]+-\d+', message, re.IGNORECASE):
-        return True
-    
-    # Check for keywords
-    if any(keyword in message_lower for keyword in jira_keywords):
-        return True
-    
-    return False
-
-
-def is_github_request(message: str) -> bool:
-    """
-    Determine if a message is a GitHub-related request.
-    
-    Args:
-        message: User message
+        Batch Mode costs 50% less and has higher rate limits, but jobs finish in
+        minutes to hours, so use it only for offline work (nightly digests,
+        backfill summaries) - never for interactive Slack replies. Each message is
+        sent straight to the model with the agent's instructions, without tools
+        or memory. Requires GEMINI_API_KEY (Gemini API batch jobs).
         
-    Returns:
-        True if message appears to be GitHub-related
-    """
-    message_lower = message.lower()
-    
-    # GitHub keywords
-    github_keywords = [
-        "github", "pr", "pull request", "pull-request", "pullrequest",
-        "merge", "review", "approve", "ci", "checks", "status",
-        "assign", "label", "commit", "branch", "repo", "repository"
-    ]
-    
-    # Check for PR number pattern (e.g., "PR #42", "pull request 10", "#5")
-    import re
-    if re.search(r'(?:pr|pull\s*request|#)\s*#?\d+', message_lower):
-        return True
-    
-    # Check for keywords
-    if any(keyword in message_lower for keyword in github_keywords):
-        return True
-    
-    return False
-
-
-def is_calendar_request(message: str) -> bool:
-    """
-    Determine if a message is a Calendar-related request.
-    
-    Args:
-        message: User message
+        Args:
+            messages: Independent user messages
+            poll_interval: Seconds between job status checks
+            
+        Returns:
+            Response text for each message, in input order
+        """
+        from google import genai
         
-    Returns:
-        True if message appears to be Calendar-related
-    """
-    message_lower = message.lower()
-    
-    # Calendar keywords
-    calendar_keywords = [
-        "calendar", "availability", "free", "schedule", "meeting",
-        "event", "appointment", "busy", "slot", "time slot"
-    ]
-    
-    # Check for keywords
-    if any(keyword in message_lower for keyword in calendar_keywords):
-        return True
-    
-    return False
-
-
-def is_memory_request(message: str) -> bool:
-    """
-    Determine if a message is a memory/context-related request.
-    
-    Args:
-        message: User message
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not set. Batch Mode requires a Gemini API key.")
         
-    Returns:
-        True if message appears to be memory-related
-    """
-    message_lower = message.lower()
-    
-    # Memory/Context keywords
-    memory_keywords = [
-        "remember", "forget", "recall", "memorize",
-        "i am", "my name is", "my role", "my skill",
-        "who am i", "what do you know", "context",
-        "save this", "note that", "update my"
-    ]
-    
-    # Check for keywords
-    if any(keyword in message_lower for keyword in memory_keywords):
-        return True
-    
-    return False
-
-
-def should_use_agno(message: str) -> bool:
-    """
-    Determine if a message should be handled by Agno agent.
-    
-    Agno handles: Jira, GitHub, Calendar, and multi-tool orchestration.
-    
-    Args:
-        message: User message
+        client = genai.Client(api_key=api_key)
+        requests = [
+            {
+                "contents": [{"role": "user", "parts": [{"text": message}]}],
+                "config": {"system_instruction": self.agent.instructions}
+            }
+            for message in messages
+        ]
         
-    Returns:
-        True if message should be routed to Agno
-    """
-    return (
-        is_jira_request(message) or 
-        is_github_request(message) or 
-        is_calendar_request(message) or 
-        is_memory_request(message)
-    )
+        job = await client.aio.batches.create(
+            model=GEMINI_MODEL_ID,
+            src=requests,
+            config={"display_name": "continuum-batch"}
+        )
+        logger.info("Submitted Gemini batch job %s with %d requests", job.name, len(requests))
+        
+        while job.state.name not in _BATCH_DONE_STATES:
+            await asyncio.sleep(poll_interval)
+            job = await client.aio.batches.get(name=job.name)
+        
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Gemini batch job {job.name} ended with state {job.state.name}")
+        
+        # Inline responses come back in request order
+        return [
+            item.response.text if item.response else f"Error: {item.error}"
+            for item in job.dest.inlined_responses
+        ]
@@ -0,0 +1,132 @@
+"""
+Keyword routing for continuum.ai Slack messages.
+
+Decides whether a message goes to the Agno agent. Kept free of Agno and tool
+imports so Slack paths that never build an agent stay cheap to import.
+"""
+
+import re
+
+# Jira keywords
+_JIRA_KEYWORDS = (
+    "jira", "issue", "task", "board", "project",
+    "assign", "reassign", "create issue", "update issue",
+    "kan-", "proj-", "bug-", "story-", "epic-"
+)
+
+# GitHub keywords
+_GITHUB_KEYWORDS = (
+    "github", "pr", "pull request", "pull-request", "pullrequest",
+    "merge", "review", "approve", "ci", "checks", "status",
+    "assign", "label", "commit", "branch", "repo", "repository"
+)
+
+# Keywords and Jira issue keys (e.g., KAN-2, PROJ-123) in one alternation
+_JIRA_KW_RE = re.compile(
+    "|".join(map(re.escape, _JIRA_KEYWORDS)) + r"|[A-Z]+-\d+",
+    re.IGNORECASE
+)
+
+# Keywords and PR numbers (e.g., "PR #42", "pull request 10", "#5") in one alternation
+_GH_KW_RE = re.compile(
+    "|".join(map(re.escape, _GITHUB_KEYWORDS)) + r"|(?:pr|pull\s*request|#)\s*#?\d+",
+    re.IGNORECASE
+)
+
+
+def is_jira_request(message: str) -> bool:
+    """
+    Determine if a message is a Jira-related request.
+    
+    Args:
+        message: User message
+        
+    Returns:
+        True if message appears to be Jira-related
+    """
+    return bool(_JIRA_KW_RE.search(message))
+
+
+def is_github_request(message: str) -> bool:
+    """
+    Determine if a message is a GitHub-related request.
+    
+    Args:
+        message: User message
+        
+    Returns:
+        True if message appears to be GitHub-related
+    """
+    return bool(_GH_KW_RE.search(message))
+
+
+def is_calendar_request(message: str) -> bool:
+    """
+    Determine if a message is a Calendar-related request.
+    
+    Args:
+        message: User message
+        
+    Returns:
+        True if message appears to be Calendar-related
+    """
+    message_lower = message.lower()
+    
+    # Calendar keywords
+    calendar_keywords = [
+        "calendar", "availability", "free", "schedule", "meeting",
+        "event", "appointment", "busy", "slot", "time slot"
+    ]
+    
+    # Check for keywords
+    if any(keyword in message_lower for keyword in calendar_keywords):
+        return True
+    
+    return False
+
+
+def is_memory_request(message: str) -> bool:
+    """
+    Determine if a message is a memory/context-related request.
+    
+    Args:
+        message: User message
+        
+    Returns:
+        True if message appears to be memory-related
+    """
+    message_lower = message.lower()
+    
+    # Memory/Context keywords
+    memory_keywords = [
+        "remember", "forget", "recall", "memorize",
+        "i am", "my name is", "my role", "my skill",
+        "who am i", "what do you know", "context",
+        "save this", "note that", "update my"
+    ]
+    
+    # Check for keywords
+    if any(keyword in message_lower for keyword in memory_keywords):
+        return True
+    
+    return False
+
+
+def should_use_agno(message: str) -> bool:
+    """
+    Determine if a message should be handled by Agno agent.
+    
+    Agno handles: Jira, GitHub, Calendar, and multi-tool orchestration.
+    
+    Args:
+        message: User message
+        
+    Returns:
+        True if message should be routed to Agno
+    """
+    return (
+        is_jira_request(message) or 
+        is_github_request(message) or 
+        is_calendar_request(message) or 
+        is_memory_request(message)
+    )
@@ -0,0 +1,126 @@
+"""
+Agno tool function for running several independent tools concurrently.
+
+Lets the model fan out Jira, GitHub, and Calendar calls in one step instead of
+waiting for each round-trip in turn.
+"""
+
+import asyncio
+import logging
+from app.agno_tools.jira_tools import (
+    get_jira_issues_tool,
+    get_jira_issue_tool,
+    get_jira_projects_tool,
+    get_jira_boards_tool,
+    get_jira_board_issues_tool,
+    find_jira_user_tool,
+    create_jira_issue_tool,
+    update_jira_issue_tool
+)
+from app.agno_tools.github_tools import (
+    get_github_pulls_tool,
+    get_github_pull_tool,
+    get_github_pr_context_tool,
+    get_github_pr_checks_tool,
+    get_github_pr_reviews_tool,
+    get_github_commits_tool,
+    get_github_repo_tool,
+    create_github_pr_tool,
+    update_github_pr_tool,
+    update_github_pr_assignees_tool,
+    update_github_pr_labels_tool,
+    request_github_pr_review_tool
+)
+from app.agno_tools.calendar_tools import (
+    list_calendars_tool,
+    get_calendar_events_tool,
+    get_calendar_availability_tool,
+    get_today_events_tool,
+    get_this_week_availability_tool,
+    create_calendar_event_tool
+)
+
+logger = logging.getLogger(__name__)
+
+# Tools that can be invoked through batch_tool, keyed by function name
+TOOLS = {
+    tool.__name__: tool
+    for tool in (
+        get_jira_issues_tool,
+        get_jira_issue_tool,
+        get_jira_projects_tool,
+        get_jira_boards_tool,
+        get_jira_board_issues_tool,
+        find_jira_user_tool,
+        create_jira_issue_tool,
+        update_jira_issue_tool,
+        get_github_pulls_tool,
+        get_github_pull_tool,
+        get_github_pr_context_tool,
+        get_github_pr_checks_tool,
+        get_github_pr_reviews_tool,
+        get_github_commits_tool,
+        get_github_repo_tool,
+        create_github_pr_tool,
+        update_github_pr_tool,
+        update_github_pr_assignees_tool,
+        update_github_pr_labels_tool,
+        request_github_pr_review_tool,
+        list_calendars_tool,
+        get_calendar_events_tool,
+        get_calendar_availability_tool,
+        get_today_events_tool,
+        get_this_week_availability_tool,
+        create_calendar_event_tool
+    )
+}
+
+
+async def _invoke(invocation: dict) -> dict:
+    """Run a single invocation, turning malformed entries and tool errors into error results."""
+    if not isinstance(invocation, dict):
+        return {"success": False, "error": f"Invocation must be an object, got {type(invocation).__name__}"}
+    tool_name = invocation.get("tool_name")
+    arguments = invocation.get("arguments") or {}
+    tool = TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+    if tool is None:
+        return {"success": False, "error": f"Unknown tool '{tool_name}'"}
+    if not isinstance(arguments, dict):
+        return {"success": False, "error": f"Arguments for {tool_name} must be an object"}
+    try:
+        return await tool(**arguments)
+    except Exception as e:
+        logger.error(f"Error running {tool_name} in batch: {e}", exc_info=True)
+        return {"success": False, "error": str(e)}
+
+
+async def batch_tool(invocations: list[dict]) -> dict:
+    """
+    Run several independent tools concurrently.
+    
+    Only batch calls whose inputs don't depend on each other's outputs. A
+    malformed or failing invocation gets its own error result without
+    affecting the others.
+    
+    Args:
+        invocations: List of {"tool_name": ..., "arguments": {...}} objects, e.g.
+            [{"tool_name": "get_today_events_tool", "arguments": {}},
+             {"tool_name": "get_github_pulls_tool", "arguments": {"state": "open"}}]
+    
+    Returns:
+        One result per invocation, in the same order, each tagged with its tool_name
+    """
+    if not isinstance(invocations, list):
+        return {"success": False, "error": "invocations must be a list"}
+    results = await asyncio.gather(*(_invoke(invocation) for invocation in invocations))
+    return {
+        "success": True,
+        "count": len(results),
+        "results": [
+            {
+                "tool_name": invocation.get("tool_name") if isinstance(invocation, dict) else None,
+                **result
+            }
+            for invocation, result in zip(invocations, results)
+        ]
+    }
@@ -0,0 +1,280 @@
+"""
+In-process stale-while-revalidate cache for read-only Agno and MCP tools.
+
+An agent turn often repeats the same lookup (a PR, its checks, the board list)
+several times. Fresh results are served from memory; slightly stale results are
+served immediately while a background refresh runs; anything older is fetched
+again. Only successful results are cached: dicts reporting success=False are
+skipped, and tools without a success flag are expected to raise on errors.
+Identical calls that overlap in time share a single upstream request.
+
+When REDIS_URL is set, fresh results are also shared through Redis so other
+worker processes can skip the upstream call on a local miss.
+"""
+
+import os
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+import orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+_REDIS_PREFIX = "continuum:tool:"
+# Per-tool Redis set of that tool's result keys, so invalidation needn't SCAN
+_REDIS_KEYS_PREFIX = "continuum:toolkeys:"
+_redis = None
+
+_MAX_ENTRIES = 512
+
+# (tool name, argument digest) -> (stored at, unusable after, result);
+# insertion order = age
+_entries: dict[tuple[str, str], tuple[float, float, dict]] = {}
+_refreshing: set[tuple[str, str]] = set()
+# Bumped on every invalidation; a fetch started under an older generation may
+# hold pre-write data, so its result is returned but not stored
+_generation = 0
+_background_tasks: set[asyncio.Task] = set()
+# Names of all cached tools, and when each was last invalidated (wall clock, to
+# compare with the "t" of shared entries)
+_tool_names: set[str] = set()
+_invalidated_at: dict[str, float] = {}
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key."""
+    
+    def __init__(self):
+        self.inflight: dict[Hashable, asyncio.Task] = {}
+    
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the running call for key, or start one with coro_factory."""
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the others' call
+        return await asyncio.shield(task)
+
+
+_flights = SingleFlight()
+
+
+def _call_key(func: Callable, signature: inspect.Signature, args: tuple, kwargs: dict) -> tuple[str, str]:
+    """Key a call by function name and a digest of its bound arguments."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    digest = hashlib.blake2b(
+        orjson.dumps(bound.arguments, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).hexdigest()
+    return (func.__name__, digest)
+
+
+def _is_success(result: Any) -> bool:
+    """A result is cacheable unless it is a dict reporting success=False."""
+    return not isinstance(result, dict) or bool(result.get("success", True))
+
+
+def _store(key: tuple[str, str], result: Any, lifetime: float, age: float = 0.0) -> None:
+    """Store a successful result, evicting the oldest entry when full."""
+    if not _is_success(result):
+        return
+    now = time.monotonic()
+    _entries.pop(key, None)
+    _entries[key] = (now - age, now - age + lifetime, result)
+    if len(_entries) > _MAX_ENTRIES:
+        del _entries[next(iter(_entries))]
+
+
+def _get_redis():
+    """Get the shared Redis client, or None if REDIS_URL is unset or redis isn't installed."""
+    global _redis
+    if _redis is None and REDIS_AVAILABLE:
+        url = os.getenv("REDIS_URL")
+        if url:
+            _redis = aioredis.from_url(url)
+    return _redis
+
+
+async def _load_shared(key: tuple[str, str], ttl_seconds: float) -> tuple[dict, float] | None:
+    """Read a still-fresh (result, age) from Redis, or None."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(f"{_REDIS_PREFIX}{key[0]}:{key[1]}")
+        if raw is None:
+            return None
+        entry = orjson.loads(raw)
+        stored_at = entry["t"]
+        result = entry["r"]
+    except Exception as e:
+        logger.warning(f"Redis read failed: {e}")
+        return None
+    # The Redis delete after a write runs in the background; until it lands,
+    # entries stored before the write are still there and must not be used
+    if stored_at <= _invalidated_at.get(key[0], 0.0):
+        return None
+    age = max(time.time() - stored_at, 0.0)
+    return (result, age) if age < ttl_seconds else None
+
+
+async def _save_shared(key: tuple[str, str], result: dict, ttl_seconds: float) -> None:
+    """Write a successful result to Redis for ttl_seconds."""
+    client = _get_redis()
+    if client is None or not _is_success(result):
+        return
+    redis_key = f"{_REDIS_PREFIX}{key[0]}:{key[1]}"
+    keys_set = f"{_REDIS_KEYS_PREFIX}{key[0]}"
+    expiry = max(int(ttl_seconds), 1)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(redis_key, orjson.dumps({"t": time.time(), "r": result}), ex=expiry)
+            pipe.sadd(keys_set, redis_key)
+            # A tool's TTL is fixed, so the set outlives every key it lists
+            pipe.expire(keys_set, expiry)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
+
+
+async def _delete_shared(tool_names: list[str]) -> None:
+    """Delete the Redis entries of the given tools."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        for name in tool_names:
+            keys_set = f"{_REDIS_KEYS_PREFIX}{name}"
+            keys = await client.smembers(keys_set)
+            await client.unlink(keys_set, *keys)
+    except Exception as e:
+        logger.warning(f"Redis invalidation failed: {e}")
+
+
+def _spawn(coro: Awaitable[Any]) -> None:
+    """Run a coroutine in the background, keeping a reference until it finishes."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def cached_tool(ttl_seconds: float = 60.0, swr_seconds: float = 300.0):
+    """
+    Cache an async tool's result keyed by its name and arguments.
+
+    Args:
+        ttl_seconds: How long a result is served without revalidating
+        swr_seconds: How much longer a stale result may be served while it
+            is refreshed in the background
+    """
+    def decorator(func: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+        signature = inspect.signature(func)
+        _tool_names.add(func.__name__)
+
+        async def _fetch(key: tuple[str, str], args: tuple, kwargs: dict) -> dict:
+            generation = _generation
+            # Another worker may have fetched it recently
+            shared = await _load_shared(key, ttl_seconds)
+            if shared is not None:
+                result, age = shared
+                if generation == _generation:
+                    _store(key, result, ttl_seconds + swr_seconds, age)
+                return result
+            result = await func(*args, **kwargs)
+            if generation == _generation:
+                _store(key, result, ttl_seconds + swr_seconds)
+                await _save_shared(key, result, ttl_seconds)
+            return result
+
+        async def _refresh(key: tuple[str, str], args: tuple, kwargs: dict) -> None:
+            try:
+                await _flights.do((key, _generation), lambda: _fetch(key, args, kwargs))
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__} failed: {e}")
+            finally:
+                _refreshing.discard(key)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict:
+            key = _call_key(func, signature, args, kwargs)
+            entry = _entries.get(key)
+            if entry is not None:
+                stored_at, _, result = entry
+                age = time.monotonic() - stored_at
+                if age < ttl_seconds:
+                    return result
+                if age < ttl_seconds + swr_seconds:
+                    if key not in _refreshing:
+                        _refreshing.add(key)
+                        _spawn(_refresh(key, args, kwargs))
+                    return result
+
+            # Keyed by generation too, so a read after a write doesn't join a
+            # fetch that started before it
+            return await _flights.do((key, _generation), lambda: _fetch(key, args, kwargs))
+
+        return wrapper
+    return decorator
+
+
+def singleflight(func: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """Coalesce concurrent identical calls of an uncached read-only tool."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict:
+        key = _call_key(func, signature, args, kwargs)
+        return await _flights.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def invalidate_tool_cache(prefix: str = "") -> None:
+    """
+    Drop cached results for tools whose name starts with prefix (all if empty).
+
+    Write tools call this so a follow-up read sees their change. Fetches
+    already in flight still return their result but no longer cache it, and
+    shared entries stored before now are ignored while the Redis delete runs.
+    """
+    global _generation
+    _generation += 1
+    names = [name for name in _tool_names if name.startswith(prefix)]
+    now = time.time()
+    for name in names:
+        _invalidated_at[name] = now
+    for key in [k for k in _entries if k[0].startswith(prefix)]:
+        del _entries[key]
+    if names and _get_redis() is not None:
+        _spawn(_delete_shared(names))
+
+
+def sweep_expired_cache() -> int:
+    """Drop entries too old to be served even as stale; returns how many were removed."""
+    now = time.monotonic()
+    expired = [key for key, (_, dead_at, _) in _entries.items() if dead_at <= now]
+    for key in expired:
+        del _entries[key]
+    return len(expired)
+
+
+async def periodic_cleanup(interval_seconds: float = 300.0) -> None:
+    """Sweep expired entries every interval_seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        removed = sweep_expired_cache()
+        if removed:
+            logger.debug(f"Swept {removed} expired tool cache entries")
@@ -4,18 +4,128 @@ Agno tool functions for Calendar operations.
 Simple functions that wrap existing Calendar functions for Agno.
 """
 
+import re
+import asyncio
 import logging
+from datetime import datetime
 from typing import Optional
+from fastapi import HTTPException
+from pydantic import TypeAdapter
 from app.tools.calendar import (
+    CalendarEvent,
     list_calendars,
     get_events,
     get_availability,
     get_today_events,
-    get_this_week_availability
+    get_this_week_availability,
+    _normalize_calendar_id,
+    _get_credentials
 )
 
+try:
+    import httplib2
+    from googleapiclient.discovery import build
+    from google.auth.transport.requests import Request
+    from google_auth_httplib2 import AuthorizedHttp
+    _GCAL_AVAILABLE = True
+except ImportError:
+    _GCAL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "list_calendars_tool",
+    "get_calendar_events_tool",
+    "get_calendar_availability_tool",
+    "get_today_events_tool",
+    "get_this_week_availability_tool",
+    "create_calendar_event_tool",
+]
+
+# Dumps a whole event list in one call instead of per-event model_dump()
+_EventListAdapter = TypeAdapter(list[CalendarEvent])
+
+# Slack link ('<mailto:a@b.com|a@b.com>') or bracketed value ('<a@b.com>') -> inner address
+_SLACK_MAILTO_RE = re.compile(r'^<(?:mailto:)?([^|>]+)(?:\|[^>]*)?>$')
+
+# Non-ISO date formats accepted for event start/end, tried in order
+_DT_FORMATS = (
+    '%d-%m-%Y %H:%M',     # 30-12-2025 10:00
+    '%d-%m-%Y %H:%M:%S',  # 30-12-2025 10:00:00
+    '%Y-%m-%d %H:%M',     # 2025-12-30 10:00
+    '%Y-%m-%d %H:%M:%S',  # 2025-12-30 10:00:00
+    '%d/%m/%Y %H:%M',     # 30/12/2025 10:00
+    '%m/%d/%Y %H:%M',     # 12/30/2025 10:00
+    '%d-%m-%Y',           # 30-12-2025
+    '%Y-%m-%d',           # 2025-12-30
+)
+
+
+def _normalize_datetime(date_str: str) -> str:
+    """Convert date string to ISO format (naive times are treated as UTC)."""
+    date_str = date_str.strip()
+    
+    # ISO format (with or without offset) - one C-level parse
+    try:
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return dt.isoformat() if dt.tzinfo else dt.isoformat() + 'Z'
+    except ValueError:
+        pass
+    
+    for fmt in _DT_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).isoformat() + 'Z'
+        except ValueError:
+            continue
+    
+    # If all parsing fails, return as-is and let Google Calendar API handle it
+    return date_str
+
+
+# Write-scoped (credentials, service) pair shared across event creations
+_cached_service = None
+_service_lock = asyncio.Lock()
+
+
+def _load_calendar_service():
+    """Load write-scoped credentials and build the Calendar client (blocking)."""
+    creds = _get_credentials(scope='write')
+    service = build('calendar', 'v3', credentials=creds, cache_discovery=False, static_discovery=True)
+    return creds, service
+
+
+def _insert_event(creds, service, calendar_id: str, event_body: dict) -> dict:
+    """Insert an event (blocking). Uses its own transport since httplib2 is not thread-safe."""
+    http = AuthorizedHttp(creds, http=httplib2.Http())
+    return service.events().insert(
+        calendarId=calendar_id,
+        body=event_body
+    ).execute(http=http)
+
+
+async def _get_calendar_service():
+    """
+    Get write-scoped Calendar (credentials, service), reusing the cached pair.
+    
+    Credentials are loaded and the discovery client is built once; later calls
+    only refresh the token when it has expired. Blocking work runs in a worker
+    thread, and the lock ensures a single concurrent load/refresh.
+    """
+    global _cached_service
+    async with _service_lock:
+        if _cached_service is not None:
+            creds, service = _cached_service
+            if not creds.expired:
+                return _cached_service
+            try:
+                await asyncio.to_thread(creds.refresh, Request())
+                return _cached_service
+            except Exception as e:
+                logger.warning(f"Calendar token refresh failed, reloading credentials: {e}")
+        
+        _cached_service = await asyncio.to_thread(_load_calendar_service)
+        return _cached_service
+
 
 async def list_calendars_tool() -> dict:
     """List all accessible calendars. Returns calendar id, summary, description, and primary flag."""
@@ -42,7 +152,7 @@ async def get_calendar_events_tool(
         return {
             "success": True,
             "count": len(events),
-            "events": [event.model_dump() for event in events]
+            "events": _EventListAdapter.dump_python(events)
         }
     except Exception as e:
         logger.error(f"Error getting calendar events: {e}", exc_info=True)
@@ -81,7 +191,7 @@ async def get_today_events_tool(calendar_id: str = "primary") -> dict:
         return {
             "success": True,
             "count": len(events),
-            "events": [event.model_dump() for event in events]
+            "events": _EventListAdapter.dump_python(events)
         }
     except Exception as e:
         logger.error(f"Error getting today's events: {e}", exc_info=True)
@@ -133,13 +243,7 @@ async def create_calendar_event_tool(
     Returns:
         Created event details
     """
-    try:
-        from googleapiclient.discovery import build
-        from app.tools.calendar import _normalize_calendar_id, _get_credentials
-        from datetime import datetime
-        import re
-        from fastapi import HTTPException
-    except ImportError:
+    if not _GCAL_AVAILABLE:
         return {
             "success": False,
             "error": "Google Calendar API libraries not installed. Run: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
@@ -147,64 +251,17 @@ async def create_calendar_event_tool(
     
     try:
         # Extract email from Slack link format if present (e.g., '<mailto:email@example.com|email@example.com>' -> 'email@example.com')
-        if calendar_id.startswith('<mailto:') and '|' in calendar_id:
-            # Extract email from Slack link format
-            match = re.search(r'mailto:([^|>]+)', calendar_id)
-            if match:
-                calendar_id = match.group(1)
-        elif calendar_id.startswith('<') and calendar_id.endswith('>'):
-            # Remove angle brackets if present
-            calendar_id = calendar_id.strip('<>')
-        
-        # Parse and normalize date strings if not already in ISO format
-        def normalize_datetime(date_str: str) -> str:
-            """Convert date string to ISO format."""
-            date_str = date_str.strip()
-            
-            # If already in ISO format, return as-is
-            if 'T' in date_str and ('Z' in date_str or '+' in date_str or '-' in date_str[-6:]):
-                return date_str
-            
-            # Try to parse common formats
-            formats = [
-                '%d-%m-%Y %H:%M',      # 30-12-2025 10:00
-                '%d-%m-%Y %H:%M:%S',  # 30-12-2025 10:00:00
-                '%Y-%m-%d %H:%M',     # 2025-12-30 10:00
-                '%Y-%m-%d %H:%M:%S',  # 2025-12-30 10:00:00
-                '%d/%m/%Y %H:%M',     # 30/12/2025 10:00
-                '%m/%d/%Y %H:%M',     # 12/30/2025 10:00
-            ]
-            
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.isoformat() + 'Z'
-                except ValueError:
-                    continue
-            
-            # If parsing fails, try to add time if only date provided
-            try:
-                dt = datetime.strptime(date_str, '%d-%m-%Y')
-                return dt.isoformat() + 'Z'
-            except ValueError:
-                pass
-            
-            try:
-                dt = datetime.strptime(date_str, '%Y-%m-%d')
-                return dt.isoformat() + 'Z'
-            except ValueError:
-                pass
-            
-            # If all parsing fails, return as-is and let Google Calendar API handle it
-            return date_str
+        match = _SLACK_MAILTO_RE.match(calendar_id)
+        if match:
+            calendar_id = match.group(1)
         
         # Normalize start and end times
-        start = normalize_datetime(start)
-        end = normalize_datetime(end)
+        start = _normalize_datetime(start)
+        end = _normalize_datetime(end)
         
-        # Get credentials with write permissions using the existing function
+        # Get the cached write-scoped service (loads credentials on first use)
         try:
-            creds = _get_credentials(scope='write')
+            creds, service = await _get_calendar_service()
         except HTTPException as e:
             # Handle HTTPException from _get_credentials
             return {
@@ -218,8 +275,6 @@ async def create_calendar_event_tool(
                 "error": f"Google Calendar credentials error: {str(cred_error)}"
             }
         
-        service = build('calendar', 'v3', credentials=creds)
-        
         # Normalize calendar ID
         calendar_id = _normalize_calendar_id(calendar_id)
         
@@ -245,11 +300,10 @@ async def create_calendar_event_tool(
         if attendees:
             event_body['attendees'] = [{'email': email} for email in attendees]
         
-        # Create event
-        created_event = service.events().insert(
-            calendarId=calendar_id,
-            body=event_body
-        ).execute()
+        # Create event off the event loop
+        created_event = await asyncio.to_thread(
+            _insert_event, creds, service, calendar_id, event_body
+        )
         
         return {
             "success": True,
@@ -4,9 +4,15 @@ Agno tool functions for GitHub operations.
 Simple functions that wrap existing GitHub functions for Agno.
 """
 
+import os
 import logging
 from typing import Optional
+from pydantic import TypeAdapter
+from app.agno_tools.cache import cached_tool, invalidate_tool_cache
 from app.tools.github import (
+    GitHubPR,
+    GitHubReview,
+    GitHubCommit,
     get_pull_requests,
     get_pull_request,
     get_pr_context,
@@ -23,7 +29,21 @@ from app.tools.github import (
 
 logger = logging.getLogger(__name__)
 
+# Cached pulls/pull/pr_* reads that PR writes make stale (repo metadata is left alone)
+_PR_TOOLS_PREFIX = "get_github_p"
 
+# Dump whole result lists in one call instead of per-item model_dump()
+_PRListAdapter = TypeAdapter(list[GitHubPR])
+_ReviewListAdapter = TypeAdapter(list[GitHubReview])
+_CommitListAdapter = TypeAdapter(list[GitHubCommit])
+
+
+def _default_repo(owner: Optional[str], repo: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """Fill in owner/repo from GITHUB_OWNER / GITHUB_REPO when not given."""
+    return owner or os.getenv("GITHUB_OWNER"), repo or os.getenv("GITHUB_REPO")
+
+
+@cached_tool()
 async def get_github_pulls_tool(state: str = "open", owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """List pull requests. Use state='open' (default), 'closed', or 'all'."""
     try:
@@ -31,26 +51,24 @@ async def get_github_pulls_tool(state: str = "open", owner: Optional[str] = None
         return {
             "success": True,
             "count": len(prs),
-            "pulls": [pr.model_dump() for pr in prs]
+            "pulls": _PRListAdapter.dump_python(prs)
         }
     except Exception as e:
         logger.error(f"Error getting GitHub PRs: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+@cached_tool()
 async def get_github_pull_tool(pr_number: int, owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """Get details of a specific PR by number. Returns PR details including title, state, size, branches, etc. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         pr = await get_pull_request(pr_number, owner=owner, repo=repo)
         return {"success": True, "pull": pr.model_dump()}
@@ -63,19 +81,17 @@ async def get_github_pull_tool(pr_number: int, owner: Optional[str] = None, repo
         return {"success": False, "error": error_msg}
 
 
+@cached_tool()
 async def get_github_pr_context_tool(pr_number: int, owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """Get comprehensive PR context including CI status, reviews, and approvals. Returns full context for decision-making. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         context = await get_pr_context(pr_number, owner=owner, repo=repo)
         return {"success": True, **context}
@@ -88,19 +104,17 @@ async def get_github_pr_context_tool(pr_number: int, owner: Optional[str] = None
         return {"success": False, "error": error_msg}
 
 
+@cached_tool()
 async def get_github_pr_checks_tool(pr_number: int, owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """Get CI/CD check status for a PR. Returns check runs and overall conclusion. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         checks = await get_pr_checks(pr_number, owner=owner, repo=repo)
         return {"success": True, "checks": checks.model_dump()}
@@ -113,25 +127,23 @@ async def get_github_pr_checks_tool(pr_number: int, owner: Optional[str] = None,
         return {"success": False, "error": error_msg}
 
 
+@cached_tool()
 async def get_github_pr_reviews_tool(pr_number: int, owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """Get reviews for a PR. Returns list of reviews with user, state, and timestamp. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         reviews = await get_pr_reviews(pr_number, owner=owner, repo=repo)
         return {
             "success": True,
             "count": len(reviews),
-            "reviews": [review.model_dump() for review in reviews]
+            "reviews": _ReviewListAdapter.dump_python(reviews)
         }
     except Exception as e:
         error_msg = str(e)
@@ -142,6 +154,7 @@ async def get_github_pr_reviews_tool(pr_number: int, owner: Optional[str] = None
         return {"success": False, "error": error_msg}
 
 
+@cached_tool()
 async def get_github_commits_tool(
     owner: Optional[str] = None,
     repo: Optional[str] = None,
@@ -154,13 +167,15 @@ async def get_github_commits_tool(
         return {
             "success": True,
             "count": len(commits),
-            "commits": [commit.model_dump() for commit in commits]
+            "commits": _CommitListAdapter.dump_python(commits)
         }
     except Exception as e:
         logger.error(f"Error getting GitHub commits: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+# Repo metadata changes on the scale of days; repository webhooks invalidate it
+@cached_tool(ttl_seconds=24 * 3600)
 async def get_github_repo_tool(owner: Optional[str] = None, repo: Optional[str] = None) -> dict:
     """Get information about the GitHub repository. Returns repo details including name, description, default branch, etc."""
     try:
@@ -189,6 +204,7 @@ async def create_github_pr_tool(
             owner=owner,
             repo=repo
         )
+        invalidate_tool_cache(_PR_TOOLS_PREFIX)
         return {"success": True, "pull": pr.model_dump()}
     except Exception as e:
         logger.error(f"Error creating GitHub PR: {e}", exc_info=True)
@@ -207,17 +223,17 @@ async def update_github_pr_tool(
 ) -> dict:
     """Update an existing PR. Can update title, body/description, state (open/closed), or base branch. Use 'description' parameter as alias for body."""
     try:
-        # Use description if provided, otherwise body
-        body_to_use = description if description else body
         pr = await update_pull_request(
             pr_number=pr_number,
             title=title,
-            body=body_to_use,
+            body=body,
+            description=description,
             state=state,
             base=base,
             owner=owner,
             repo=repo
         )
+        invalidate_tool_cache(_PR_TOOLS_PREFIX)
         return {"success": True, "pull": pr.model_dump()}
     except Exception as e:
         logger.error(f"Error updating GitHub PR {pr_number}: {e}", exc_info=True)
@@ -234,15 +250,12 @@ async def update_github_pr_assignees_tool(
     """Add or remove assignees from a PR. Provide list of GitHub usernames to add or remove. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": "Repository not specified and GITHUB_OWNER/GITHUB_REPO not set in environment. Please specify owner and repo, or set them in .env"
-                }
+            return {
+                "success": False,
+                "error": "Repository not specified and GITHUB_OWNER/GITHUB_REPO not set in environment. Please specify owner and repo, or set them in .env"
+            }
         
         result = await update_pr_assignees(
             pr_number=pr_number,
@@ -251,6 +264,7 @@ async def update_github_pr_assignees_tool(
             owner=owner,
             repo=repo
         )
+        invalidate_tool_cache(_PR_TOOLS_PREFIX)
         return {"success": True, **result}
     except Exception as e:
         error_msg = str(e)
@@ -271,15 +285,12 @@ async def update_github_pr_labels_tool(
     """Add or remove labels from a PR. Provide list of label names to add or remove. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         result = await update_pr_labels(
             pr_number=pr_number,
@@ -288,6 +299,7 @@ async def update_github_pr_labels_tool(
             owner=owner,
             repo=repo
         )
+        invalidate_tool_cache(_PR_TOOLS_PREFIX)
         return {"success": True, **result}
     except Exception as e:
         error_msg = str(e)
@@ -308,15 +320,12 @@ async def request_github_pr_review_tool(
     """Request review from specific users or teams for a PR. Provide list of GitHub usernames or team slugs. If owner/repo not provided, uses default from GITHUB_OWNER and GITHUB_REPO env vars."""
     try:
         # If owner/repo not provided, use default from env
+        owner, repo = _default_repo(owner, repo)
         if not owner or not repo:
-            import os
-            owner = owner or os.getenv("GITHUB_OWNER")
-            repo = repo or os.getenv("GITHUB_REPO")
-            if not owner or not repo:
-                return {
-                    "success": False,
-                    "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
-                }
+            return {
+                "success": False,
+                "error": f"Repository not specified and GITHUB_OWNER/GITHUB_REPO not set. Please specify owner and repo for PR #{pr_number}, or set GITHUB_OWNER and GITHUB_REPO in .env"
+            }
         
         result = await request_pr_review(
             pr_number=pr_number,
@@ -325,6 +334,7 @@ async def request_github_pr_review_tool(
             owner=owner,
             repo=repo
         )
+        invalidate_tool_cache(_PR_TOOLS_PREFIX)
         return {"success": True, **result}
     except Exception as e:
         error_msg = str(e)
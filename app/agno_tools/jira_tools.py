@@ -6,8 +6,14 @@ Simple functions that wrap existing Jira functions for Agno.
 
 import logging
 from typing import Optional
+from pydantic import TypeAdapter
 import asyncio
+from app.agno_tools.cache import cached_tool, invalidate_tool_cache, singleflight
 from app.tools.jira import (
+    JiraIssue,
+    JiraIssueDetail,
+    JiraProject,
+    JiraBoard,
     get_jira_issues,
     get_single_issue,
     get_projects,
@@ -20,7 +26,14 @@ from app.tools.jira import (
 
 logger = logging.getLogger(__name__)
 
+# Dump whole result lists in one call instead of per-item model_dump()
+_IssueListAdapter = TypeAdapter(list[JiraIssue])
+_IssueDetailListAdapter = TypeAdapter(list[JiraIssueDetail])
+_ProjectListAdapter = TypeAdapter(list[JiraProject])
+_BoardListAdapter = TypeAdapter(list[JiraBoard])
 
+
+@singleflight
 async def get_jira_issues_tool(jql: str = "assignee=currentUser()") -> dict:
     """Search Jira issues using JQL (Jira Query Language). Examples: 'assignee=currentUser()', 'project=KAN AND status=Open'"""
     try:
@@ -28,13 +41,14 @@ async def get_jira_issues_tool(jql: str = "assignee=currentUser()") -> dict:
         return {
             "success": True,
             "count": len(issues),
-            "issues": [issue.model_dump() for issue in issues]
+            "issues": _IssueListAdapter.dump_python(issues)
         }
     except Exception as e:
         logger.error(f"Error getting Jira issues: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+@cached_tool()
 async def get_jira_issue_tool(issue_key: str) -> dict:
     """Get full details of a Jira issue by its key (e.g., 'KAN-2', 'PROJ-123'). Returns issue details including status, assignee, due_time, labels, etc."""
     try:
@@ -45,6 +59,7 @@ async def get_jira_issue_tool(issue_key: str) -> dict:
         return {"success": False, "error": str(e)}
 
 
+@cached_tool(ttl_seconds=600)
 async def get_jira_projects_tool() -> dict:
     """List all Jira projects accessible to the user. Returns project id, key, name, and type."""
     try:
@@ -52,13 +67,14 @@ async def get_jira_projects_tool() -> dict:
         return {
             "success": True,
             "count": len(projects),
-            "projects": [p.model_dump() for p in projects]
+            "projects": _ProjectListAdapter.dump_python(projects)
         }
     except Exception as e:
         logger.error(f"Error getting Jira projects: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+@cached_tool(ttl_seconds=600)
 async def get_jira_boards_tool() -> dict:
     """List all Jira boards (Scrum/Kanban). Returns board id, name, type, and project key."""
     try:
@@ -66,13 +82,14 @@ async def get_jira_boards_tool() -> dict:
         return {
             "success": True,
             "count": len(boards),
-            "boards": [b.model_dump() for b in boards]
+            "boards": _BoardListAdapter.dump_python(boards)
         }
     except Exception as e:
         logger.error(f"Error getting Jira boards: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+@cached_tool()
 async def get_jira_board_issues_tool(board_id: int) -> dict:
     """Get all issues from a Jira board by board ID. Extract board ID from phrases like 'board 1', 'board ID 5', etc."""
     try:
@@ -80,13 +97,14 @@ async def get_jira_board_issues_tool(board_id: int) -> dict:
         return {
             "success": True,
             "count": len(issues),
-            "issues": [issue.model_dump() for issue in issues]
+            "issues": _IssueDetailListAdapter.dump_python(issues)
         }
     except Exception as e:
         logger.error(f"Error getting board issues: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
 
+@singleflight
 async def find_jira_user_tool(name: str) -> dict:
     """Find a Jira user by their display name or email address. Returns user accountId, displayName, and emailAddress. Use this before assigning issues to users."""
     try:
@@ -122,6 +140,7 @@ async def create_jira_issue_tool(
             priority=priority,
             labels=labels
         )
+        invalidate_tool_cache("get_jira")
         return {"success": True, "issue": issue.model_dump()}
     except Exception as e:
         logger.error(f"Error creating Jira issue: {e}", exc_info=True)
@@ -150,6 +169,7 @@ async def update_jira_issue_tool(
             status=status,
             labels=labels
         )
+        invalidate_tool_cache("get_jira")
         return {"success": True, "issue": issue.model_dump()}
     except Exception as e:
         logger.error(f"Error updating Jira issue: {e}", exc_info=True)
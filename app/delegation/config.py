@@ -8,6 +8,7 @@ In production, this should fetch from:
 - Database/config file
 """
 
+import re
 from typing import List
 from app.delegation.models import Teammate
 
@@ -35,21 +36,45 @@ TEAMMATES_CONFIG = [
 ]
 
 
+def _compile_file_patterns(patterns: List[str]) -> "re.Pattern[str] | None":
+    """Compile path prefixes into one anchored alternation (None if there are none)."""
+    if not patterns:
+        return None
+    # Longest first so a shorter prefix never shadows a longer one
+    alternation = "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+    return re.compile(f"^(?:{alternation})")
+
+
+# (username, compiled file_patterns) built once at import
+_OWNER_PATTERNS = [
+    (config["username"], pattern)
+    for config in TEAMMATES_CONFIG
+    if (pattern := _compile_file_patterns(config.get("file_patterns", []))) is not None
+]
+
+
+def match_owners(path: str) -> set[str]:
+    """Return usernames of teammates whose file_patterns match the start of path."""
+    return {username for username, pattern in _OWNER_PATTERNS if pattern.match(path)}
+
+
+# Teammates built once at import; they're frozen, so callers can share them
+_TEAMMATES = tuple(
+    Teammate(
+        username=config["username"],
+        github_username=config.get("github_username"),
+        slack_user_id=config.get("slack_user_id"),
+        email=config.get("email"),
+        timezone=config.get("timezone"),
+        workload_score=0.0,  # Will be calculated dynamically
+    )
+    for config in TEAMMATES_CONFIG
+)
+
+
 async def load_teammates_from_config() -> List[Teammate]:
     """Load teammates from configuration."""
-    teammates = []
-    
-    for config in TEAMMATES_CONFIG:
-        teammates.append(Teammate(
-            username=config["username"],
-            github_username=config.get("github_username"),
-            slack_user_id=config.get("slack_user_id"),
-            email=config.get("email"),
-            timezone=config.get("timezone"),
-            workload_score=0.0,  # Will be calculated dynamically
-        ))
-    
-    return teammates
+    return list(_TEAMMATES)
 
 
 async def load_teammates_from_github(owner: str, repo: str) -> List[Teammate]:
@@ -1,11 +1,18 @@
 """Data models for delegation engine."""
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+# Delegation models are built once and passed along, never edited in place,
+# so skip assignment validation and make them immutable
+_FROZEN = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
 
 
 class Teammate(BaseModel):
     """Represents a teammate."""
+    model_config = _FROZEN
+    
     username: str
     email: Optional[str] = None
     slack_user_id: Optional[str] = None
@@ -19,6 +26,8 @@ class Teammate(BaseModel):
 
 class TeammateScore(BaseModel):
     """Scored teammate with reasoning."""
+    model_config = _FROZEN
+    
     teammate: Teammate
     total_score: float
     reasoning: str
@@ -27,6 +36,8 @@ class TeammateScore(BaseModel):
 
 class DelegationNotification(BaseModel):
     """Delegation notification details."""
+    model_config = _FROZEN
+    
     teammate: Teammate
     task_type: str  # "pr", "jira_issue"
     task_id: str
@@ -5,16 +5,32 @@ Sends smart, contextual notifications to selected teammates.
 """
 
 import os
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional
-import httpx
+import orjson
 from app.delegation.models import Teammate, DelegationNotification
+from app.http_clients import get_slack_client
 
 logger = logging.getLogger(__name__)
 
+# Slack allows at most 50 blocks per message
+_MAX_BLOCKS_PER_MESSAGE = 50
 
+_URGENCY_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+# Static block, shared by reference across messages (never mutated)
+_DIVIDER_BLOCK = {"type": "divider"}
+
+
+@lru_cache(maxsize=1)
 def _get_slack_headers() -> dict:
-    """Get Slack API headers."""
+    """Get Slack API headers (built once; the token is read from env on first use)."""
     token = os.getenv("SLACK_BOT_TOKEN")
     if not token:
         raise ValueError("SLACK_BOT_TOKEN not configured")
@@ -24,6 +40,112 @@ def _get_slack_headers() -> dict:
     }
 
 
+async def _post_message(payload: dict) -> bool:
+    """Send one chat.postMessage; returns True if Slack accepted it."""
+    client = get_slack_client()
+    response = await client.post(
+        "https://slack.com/api/chat.postMessage",
+        headers=_get_slack_headers(),
+        content=orjson.dumps(payload)
+    )
+    response.raise_for_status()
+    result = response.json()
+    
+    if not result.get("ok"):
+        logger.error(f"Slack API error: {result.get('error', 'unknown_error')}")
+        return False
+    return True
+
+
+class SlackBatcher:
+    """
+    Coalesces messages to the same channel sent within a short window.
+    
+    A burst of delegations (e.g. many PRs triaged at once) becomes one
+    chat.postMessage per recipient instead of one per task.
+    """
+    
+    def __init__(self, window_seconds: float = 0.2):
+        self._window = window_seconds
+        # Futures belong to the loop that made them, so state is kept per loop:
+        # loop -> channel -> [(text, blocks, future resolved with send success)]
+        self._pending: dict[asyncio.AbstractEventLoop, dict[str, list[tuple[str, list[dict], asyncio.Future]]]] = {}
+        self._flush_tasks: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+    
+    async def post(self, channel: str, text: str, blocks: list[dict]) -> bool:
+        """Queue a message and wait until its batch has been sent."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(loop, {}).setdefault(channel, []).append((text, blocks, future))
+        flush_task = self._flush_tasks.get(loop)
+        if flush_task is None or flush_task.done():
+            flush_task = loop.create_task(self._flush_later(loop))
+            flush_task.add_done_callback(self._on_flush_done)
+            self._flush_tasks[loop] = flush_task
+        return await future
+    
+    def _take(self, loop: asyncio.AbstractEventLoop) -> dict[str, list[tuple[str, list[dict], asyncio.Future]]]:
+        """Detach a loop's queued messages so later posts start a new batch."""
+        self._flush_tasks.pop(loop, None)
+        return self._pending.pop(loop, {})
+    
+    @staticmethod
+    def _fail(pending: dict[str, list[tuple[str, list[dict], asyncio.Future]]]) -> None:
+        """Resolve still-waiting messages as not sent."""
+        for items in pending.values():
+            for _, _, future in items:
+                if not future.done():
+                    future.set_result(False)
+    
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        # A flush cancelled before it took its batch (possibly before it even
+        # started) would otherwise leave those callers waiting forever
+        loop = task.get_loop()
+        if self._flush_tasks.get(loop) is task:
+            self._fail(self._take(loop))
+    
+    async def _flush_later(self, loop: asyncio.AbstractEventLoop):
+        pending = {}
+        try:
+            await asyncio.sleep(self._window)
+            pending = self._take(loop)
+            await asyncio.gather(*(
+                self._send(channel, items) for channel, items in pending.items()
+            ))
+        finally:
+            # Cancelled mid-send: fail the messages that weren't sent
+            self._fail(pending)
+    
+    async def _send(self, channel: str, items: list[tuple[str, list[dict], asyncio.Future]]):
+        # Merge consecutive messages while they fit in one Slack message
+        batches: list[list[tuple[str, list[dict], asyncio.Future]]] = [[]]
+        block_count = 0
+        for item in items:
+            if batches[-1] and block_count + len(item[1]) > _MAX_BLOCKS_PER_MESSAGE:
+                batches.append([])
+                block_count = 0
+            batches[-1].append(item)
+            block_count += len(item[1])
+        
+        for batch in batches:
+            payload = {
+                "channel": channel,
+                "text": "\n\n".join(text for text, _, _ in batch),
+                "blocks": [block for _, blocks, _ in batch for block in blocks]
+            }
+            try:
+                ok = await _post_message(payload)
+            except Exception as e:
+                logger.error(f"Failed to send Slack message to {channel}: {e}", exc_info=True)
+                ok = False
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(ok)
+
+
+_batcher = SlackBatcher()
+
+
 async def notify_teammate(notification: DelegationNotification) -> bool:
     """
     Notify a teammate via Slack about a delegated task.
@@ -49,32 +171,16 @@ async def notify_teammate(notification: DelegationNotification) -> bool:
     # Build message
     message = _build_delegation_message(notification)
     
-    # Send to Slack
+    # Send to Slack (batched with other notifications for the same user)
     try:
-        headers = _get_slack_headers()
-        
-        payload = {
-            "channel": channel,
-            "text": message,
-            "blocks": _build_slack_blocks(notification)  # Rich formatting
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://slack.com/api/chat.postMessage",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            if not result.get("ok"):
-                error = result.get("error", "unknown_error")
-                logger.error(f"Slack API error: {error}")
-                return False
-            
+        sent = await _batcher.post(
+            channel,
+            message,
+            _build_slack_blocks(notification)  # Rich formatting
+        )
+        if sent:
             logger.info(f"Delegation notification sent to {teammate.username}")
-            return True
+        return sent
             
     except Exception as e:
         logger.error(f"Failed to send delegation notification: {e}", exc_info=True)
@@ -83,12 +189,7 @@ async def notify_teammate(notification: DelegationNotification) -> bool:
 
 def _build_delegation_message(notification: DelegationNotification) -> str:
     """Build plain text delegation message."""
-    teammate = notification.teammate
-    urgency_emoji = {
-        "high": "🔴",
-        "medium": "🟡",
-        "low": "🟢"
-    }.get(notification.urgency, "⚪")
+    urgency_emoji = _URGENCY_EMOJI.get(notification.urgency, "⚪")
     
     lines = [
         f"{urgency_emoji} *Task Delegation*",
@@ -119,13 +220,6 @@ def _build_delegation_message(notification: DelegationNotification) -> str:
 
 def _build_slack_blocks(notification: DelegationNotification) -> list[dict]:
     """Build Slack Block Kit blocks for rich formatting."""
-    teammate = notification.teammate
-    urgency_color = {
-        "high": "#ff0000",
-        "medium": "#ffaa00",
-        "low": "#00ff00"
-    }.get(notification.urgency, "#cccccc")
-    
     blocks = [
         {
             "type": "header",
@@ -184,7 +278,7 @@ def _build_slack_blocks(notification: DelegationNotification) -> list[dict]:
         })
     
     # Add divider
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER_BLOCK)
     
     return blocks
 
@@ -210,28 +304,11 @@ async def notify_team_channel(
     )
     
     try:
-        headers = _get_slack_headers()
-        
-        payload = {
-            "channel": channel_id,
-            "text": message,
-            "blocks": _build_slack_blocks(notification)
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://slack.com/api/chat.postMessage",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            if not result.get("ok"):
-                logger.error(f"Slack API error: {result.get('error')}")
-                return False
-            
-            return True
+        return await _batcher.post(
+            channel_id,
+            message,
+            _build_slack_blocks(notification)
+        )
             
     except Exception as e:
         logger.error(f"Failed to notify team channel: {e}", exc_info=True)
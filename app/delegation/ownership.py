@@ -0,0 +1,47 @@
+"""
+Code ownership lookups for teammate selection.
+
+Fetches who authored the files a PR touches in a fixed number of GitHub
+requests, so every teammate can then be scored against the same in-memory map
+without further API calls.
+"""
+
+import logging
+from app.delegation.config import match_owners
+from app.delegation.models import Teammate
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_pr_ownership_map(pr_number: int) -> dict[str, set[str]]:
+    """
+    Map each file changed in a PR to the GitHub logins that authored it.
+    
+    Returns an empty map if the PR can't be fetched, so selection can still
+    fall back to the other scoring factors.
+    """
+    from app.tools.github import get_pr_file_authors
+    
+    try:
+        return await get_pr_file_authors(pr_number)
+    except Exception as e:
+        logger.warning(f"Could not fetch ownership for PR #{pr_number}: {e}")
+        return {}
+
+
+def owned_file_ratio(teammate: Teammate, ownership_map: dict[str, set[str]]) -> float:
+    """
+    Fraction (0-1) of the PR's files the teammate owns.
+    
+    A file counts if the teammate authored lines in it or it matches one of
+    their configured file_patterns.
+    """
+    if not ownership_map:
+        return 0.0
+    
+    login = teammate.github_username.lower() if teammate.github_username else None
+    owned = sum(
+        1 for path, logins in ownership_map.items()
+        if (login and login in logins) or teammate.username in match_owners(path)
+    )
+    return owned / len(ownership_map)
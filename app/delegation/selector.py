@@ -8,13 +8,38 @@ Selects the best teammate(s) for delegation based on:
 - Recent activity
 """
 
+import asyncio
+import heapq
 import logging
+import time
+from operator import itemgetter
 from typing import Optional, List
 from app.delegation.models import Teammate, TeammateScore
+from app.delegation.ownership import fetch_pr_ownership_map, owned_file_ratio
 from app.policy.models import TaskContext
 
 logger = logging.getLogger(__name__)
 
+# Max teammates scored at once, so scoring doesn't flood GitHub/Jira once
+# the score functions call them
+_MAX_SCORING_CONCURRENCY = 10
+
+# Combined score weights: 40% ownership, 30% low workload, 30% availability.
+# Low workload is (100 - workload) * weight, folded into a constant offset.
+_OWNERSHIP_WEIGHT = 0.4
+_WORKLOAD_WEIGHT = 0.3
+_AVAILABILITY_WEIGHT = 0.3
+_WORKLOAD_OFFSET = 100 * _WORKLOAD_WEIGHT
+
+# Reasoning for select_multiple_teammates, formatted only for returned candidates
+_REASONING_TEMPLATE = "Ownership: {o:.1f}, Workload: {w:.1f}, Availability: {a:.1f}"
+
+# Teammate list and task-independent sub-scores are reused for this long
+_TEAMMATE_CACHE_SECONDS = 60.0
+_teammate_list: tuple[float, List[Teammate]] | None = None  # (expires at, teammates)
+# username -> (expires at, workload, availability, weighted workload + availability)
+_sub_scores: dict[str, tuple[float, float, float, float]] = {}
+
 
 async def get_teammate_list() -> List[Teammate]:
     """
@@ -26,45 +51,51 @@ async def get_teammate_list() -> List[Teammate]:
     - TODO: Jira project members
     - TODO: Slack team members
     """
+    global _teammate_list
     from app.delegation.config import load_teammates_from_config
     
+    if _teammate_list is not None and _teammate_list[0] > time.monotonic():
+        return list(_teammate_list[1])
+    
     # Load from config (can be extended to fetch from APIs)
     teammates = await load_teammates_from_config()
     
     # TODO: Calculate actual workload for each teammate
-    # For now, set default workload
-    for teammate in teammates:
-        if teammate.workload_score == 0.0:
-            # TODO: Fetch actual workload from GitHub/Jira
-            teammate.workload_score = 30.0  # Default moderate workload
-    
-    return teammates
+    # For now, set default workload (teammates are frozen, so copy)
+    teammates = [
+        teammate.model_copy(update={"workload_score": 30.0})  # Default moderate workload
+        if teammate.workload_score == 0.0 else teammate
+        for teammate in teammates
+    ]
+    _teammate_list = (time.monotonic() + _TEAMMATE_CACHE_SECONDS, teammates)
+    return list(teammates)
 
 
-async def calculate_ownership_score(
+def calculate_ownership_score(
     teammate: Teammate,
     task_context: TaskContext
 ) -> float:
     """
     Calculate ownership score (0-100) based on code ownership.
     
-    For PRs: Check if teammate has contributed to files in PR
+    For PRs: Check if teammate authored the PR or owns the files it changes
+    (uses task_context.metadata["ownership_map"], see prepare_ownership_map)
     For Jira: Check if teammate owns the component/project
     """
     score = 0.0
     
     if task_context.task_type == "pr":
-        # Check if teammate has contributed to files in PR
-        # TODO: Fetch PR files and check git blame/history
-        pr_files = task_context.metadata.get("pr_data", {}).get("pr", {}).get("changed_files", 0)
-        
-        # Placeholder: If teammate's GitHub username matches PR author, higher score
-        pr_author = task_context.metadata.get("pr_data", {}).get("pr", {}).get("user", {}).get("login", "")
+        # If teammate's GitHub username matches PR author, higher score
+        pr_author = task_context.metadata.get("pr_data", {}).get("pr", {}).get("user", "")
+        if isinstance(pr_author, dict):
+            pr_author = pr_author.get("login", "")
         if teammate.github_username and pr_author.lower() == teammate.github_username.lower():
             score += 50
         
-        # TODO: Check file ownership from git history
-        # For now, give base score
+        # Up to 30 more for owning the changed files
+        score += 30 * owned_file_ratio(teammate, task_context.metadata.get("ownership_map", {}))
+        
+        # Base score
         score += 20
     
     elif task_context.task_type == "jira_issue":
@@ -77,6 +108,16 @@ async def calculate_ownership_score(
     return min(score, 100.0)
 
 
+async def prepare_ownership_map(task_context: TaskContext) -> None:
+    """Fetch a PR's file ownership once into metadata["ownership_map"] before scoring."""
+    if task_context.task_type != "pr" or "ownership_map" in task_context.metadata:
+        return
+    if not task_context.task_id.isdigit():
+        task_context.metadata["ownership_map"] = {}
+        return
+    task_context.metadata["ownership_map"] = await fetch_pr_ownership_map(int(task_context.task_id))
+
+
 async def calculate_workload_score(teammate: Teammate) -> float:
     """
     Calculate workload score (0-100).
@@ -112,6 +153,69 @@ async def calculate_availability_score(teammate: Teammate) -> float:
     return min(score, 100.0)
 
 
+async def _task_independent_scores(teammate: Teammate) -> tuple[float, float, float]:
+    """
+    Get (workload, availability, partial score), reusing recent values for this teammate.
+    
+    The partial score is the weighted workload + availability part of the
+    total, so ranking a task only has to add the weighted ownership.
+    """
+    cached = _sub_scores.get(teammate.username)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1], cached[2], cached[3]
+    
+    workload, availability = await asyncio.gather(
+        calculate_workload_score(teammate),
+        calculate_availability_score(teammate)
+    )
+    partial = _WORKLOAD_OFFSET - workload * _WORKLOAD_WEIGHT + availability * _AVAILABILITY_WEIGHT
+    _sub_scores[teammate.username] = (time.monotonic() + _TEAMMATE_CACHE_SECONDS, workload, availability, partial)
+    return workload, availability, partial
+
+
+async def _score_one(
+    teammate: Teammate,
+    task_context: TaskContext,
+    semaphore: asyncio.Semaphore
+) -> tuple[float, float, float, float]:
+    """Compute (ownership, workload, availability, partial score) for one teammate concurrently."""
+    async with semaphore:
+        workload, availability, partial = await _task_independent_scores(teammate)
+    return calculate_ownership_score(teammate, task_context), workload, availability, partial
+
+
+async def _rank_teammates(
+    task_context: TaskContext,
+    max_candidates: int
+) -> List[tuple[Teammate, float, float, float, float]]:
+    """
+    Score all teammates and return the top candidates, best first.
+    
+    Returns:
+        List of (teammate, ownership, workload, availability, total_score)
+    """
+    teammates = await get_teammate_list()
+    
+    if not teammates:
+        return []
+    
+    # Fetch PR file ownership once, then score all teammates concurrently
+    await prepare_ownership_map(task_context)
+    semaphore = asyncio.Semaphore(_MAX_SCORING_CONCURRENCY)
+    results = await asyncio.gather(*[_score_one(t, task_context, semaphore) for t in teammates])
+    
+    # Combined score (weighted): higher ownership, lower workload and higher
+    # availability are better. Only plain tuples here; TeammateScore models are
+    # built for the returned candidates only.
+    ranked = [
+        (teammate, ownership, workload, availability, ownership * _OWNERSHIP_WEIGHT + partial)
+        for teammate, (ownership, workload, availability, partial) in zip(teammates, results)
+    ]
+    
+    # Top candidates by total score (highest first) without sorting everyone
+    return heapq.nlargest(max_candidates, ranked, key=itemgetter(4))
+
+
 async def select_teammate(
     task_context: TaskContext,
     max_candidates: int = 2
@@ -128,66 +232,40 @@ async def select_teammate(
     """
     logger.info(f"Selecting teammate for {task_context.task_type} {task_context.task_id}")
     
-    # Get potential teammates
-    teammates = await get_teammate_list()
+    ranked = await _rank_teammates(task_context, 1)
     
-    if not teammates:
+    if not ranked:
         logger.warning("No teammates available for delegation")
         return None
     
-    # Score each teammate
-    scored_teammates = []
+    teammate, ownership, workload, availability, total_score = ranked[0]
     
-    for teammate in teammates:
-        # Calculate individual scores
-        ownership = await calculate_ownership_score(teammate, task_context)
-        workload = await calculate_workload_score(teammate)
-        availability = await calculate_availability_score(teammate)
-        
-        # Combined score (weighted)
-        # Higher ownership = better
-        # Lower workload = better (so invert)
-        # Higher availability = better
-        total_score = (
-            ownership * 0.4 +      # 40% weight on ownership
-            (100 - workload) * 0.3 +  # 30% weight on low workload
-            availability * 0.3      # 30% weight on availability
-        )
-        
-        # Build reasoning
-        factors = {
-            "ownership": ownership,
-            "workload": workload,
-            "availability": availability
-        }
-        
-        reasoning_parts = []
-        if ownership > 50:
-            reasoning_parts.append(f"High ownership match ({ownership:.1f})")
-        if workload < 50:
-            reasoning_parts.append(f"Low workload ({workload:.1f})")
-        if availability > 50:
-            reasoning_parts.append(f"Available ({availability:.1f})")
-        
-        reasoning = ". ".join(reasoning_parts) if reasoning_parts else "General availability"
-        
-        scored_teammates.append(TeammateScore(
-            teammate=teammate,
-            total_score=total_score,
-            reasoning=reasoning,
-            factors=factors
-        ))
+    # Build reasoning
+    factors = {
+        "ownership": ownership,
+        "workload": workload,
+        "availability": availability
+    }
     
-    # Sort by total score (highest first)
-    scored_teammates.sort(key=lambda x: x.total_score, reverse=True)
+    reasoning_parts = []
+    if ownership > 50:
+        reasoning_parts.append(f"High ownership match ({ownership:.1f})")
+    if workload < 50:
+        reasoning_parts.append(f"Low workload ({workload:.1f})")
+    if availability > 50:
+        reasoning_parts.append(f"Available ({availability:.1f})")
     
-    # Return best candidate
-    if scored_teammates:
-        best = scored_teammates[0]
-        logger.info(f"Selected teammate: {best.teammate.username} (score: {best.total_score:.1f})")
-        return best
+    reasoning = ". ".join(reasoning_parts) if reasoning_parts else "General availability"
     
-    return None
+    # Scores are computed here, so skip validation
+    best = TeammateScore.model_construct(
+        teammate=teammate,
+        total_score=total_score,
+        reasoning=reasoning,
+        factors=factors
+    )
+    logger.info(f"Selected teammate: {best.teammate.username} (score: {best.total_score:.1f})")
+    return best
 
 
 async def select_multiple_teammates(
@@ -199,40 +277,18 @@ async def select_multiple_teammates(
     
     Returns top N candidates.
     """
-    teammates = await get_teammate_list()
+    ranked = await _rank_teammates(task_context, max_candidates)
     
-    if not teammates:
-        return []
-    
-    scored_teammates = []
-    
-    for teammate in teammates:
-        ownership = await calculate_ownership_score(teammate, task_context)
-        workload = await calculate_workload_score(teammate)
-        availability = await calculate_availability_score(teammate)
-        
-        total_score = (
-            ownership * 0.4 +
-            (100 - workload) * 0.3 +
-            availability * 0.3
-        )
-        
-        factors = {
-            "ownership": ownership,
-            "workload": workload,
-            "availability": availability
-        }
-        
-        reasoning = f"Ownership: {ownership:.1f}, Workload: {workload:.1f}, Availability: {availability:.1f}"
-        
-        scored_teammates.append(TeammateScore(
+    return [
+        TeammateScore.model_construct(
             teammate=teammate,
             total_score=total_score,
-            reasoning=reasoning,
-            factors=factors
-        ))
-    
-    # Sort and return top N
-    scored_teammates.sort(key=lambda x: x.total_score, reverse=True)
-    return scored_teammates[:max_candidates]
-
+            reasoning=_REASONING_TEMPLATE.format(o=ownership, w=workload, a=availability),
+            factors={
+                "ownership": ownership,
+                "workload": workload,
+                "availability": availability
+            }
+        )
+        for teammate, ownership, workload, availability, total_score in ranked
+    ]
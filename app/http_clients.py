@@ -0,0 +1,227 @@
+"""
+Shared HTTP clients for the GitHub, Jira, and Slack APIs.
+
+One pooled httpx.AsyncClient per service keeps TLS connections alive between
+tool calls instead of opening a new connection for every request. Clients are
+built lazily on first use and closed by the FastAPI lifespan hook.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Callable
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# GitHub throttling: concurrent requests, retries on 429/secondary-limit 403s,
+# and the longest we'll wait on a rate limit before letting the call through
+_GITHUB_MAX_CONCURRENCY = 10
+_GITHUB_MAX_RETRIES = 5
+_GITHUB_LOW_REMAINING = 10
+_MAX_WAIT_SECONDS = 60.0
+
+# Most GET responses kept for conditional requests
+_MAX_ETAG_ENTRIES = 256
+
+# Headers describing the original wire encoding, which no longer applies to
+# the decoded body we keep
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class _GitHubThrottleTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that keeps GitHub calls inside its rate limits.
+    
+    Caps concurrent requests, pauses when X-RateLimit-Remaining runs low until
+    X-RateLimit-Reset, and retries 429s and secondary-limit 403s with
+    Retry-After or exponential backoff with jitter. GitHub limits REST, search,
+    and GraphQL separately, so limits are tracked per X-RateLimit-Resource.
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(_GITHUB_MAX_CONCURRENCY)
+        # Rate-limit resource -> (remaining, reset at)
+        self.limits: dict[str, tuple[int, float]] = {}
+    
+    @staticmethod
+    def _resource(request: httpx.Request) -> str:
+        """The rate-limit resource a request counts against."""
+        path = request.url.path
+        if path.endswith("/graphql"):
+            return "graphql"
+        if path.startswith("/search/"):
+            return "code_search" if path == "/search/code" else "search"
+        return "core"
+    
+    def _record_limits(self, resource: str, response: httpx.Response) -> None:
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or not remaining.isdigit():
+            return
+        resource = response.headers.get("x-ratelimit-resource", resource)
+        reset_at = float(reset) if reset is not None and reset.isdigit() else self.limits.get(resource, (0, 0.0))[1]
+        self.limits[resource] = (int(remaining), reset_at)
+    
+    def _retry_delay(self, resource: str, response: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying, or None if the response isn't a rate limit."""
+        retry_after = response.headers.get("retry-after")
+        remaining, reset_at = self.limits.get(resource, (None, 0.0))
+        if response.status_code == 403 and retry_after is None and remaining != 0:
+            return None  # A real permission error
+        if response.status_code not in (403, 429):
+            return None
+        backoff = random.uniform(0.5, 1.0) * 2 ** attempt
+        if retry_after is not None and retry_after.isdigit():
+            return min(max(float(retry_after), backoff), _MAX_WAIT_SECONDS)
+        if remaining == 0:
+            return min(max(reset_at - time.time(), backoff), _MAX_WAIT_SECONDS)
+        return min(backoff, _MAX_WAIT_SECONDS)
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        resource = self._resource(request)
+        for attempt in range(_GITHUB_MAX_RETRIES + 1):
+            remaining, reset_at = self.limits.get(resource, (None, 0.0))
+            if remaining is not None and remaining < _GITHUB_LOW_REMAINING:
+                wait = reset_at - time.time()
+                if wait > 0:
+                    logger.warning(f"GitHub {resource} rate limit low ({remaining} left), waiting {min(wait, _MAX_WAIT_SECONDS):.0f}s")
+                    await asyncio.sleep(min(wait, _MAX_WAIT_SECONDS))
+            
+            async with self._semaphore:
+                response = await self._transport.handle_async_request(request)
+            self._record_limits(resource, response)
+            
+            delay = self._retry_delay(resource, response, attempt)
+            if delay is None or attempt == _GITHUB_MAX_RETRIES:
+                return response
+            await response.aclose()
+            logger.warning(f"GitHub rate limited ({response.status_code}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return response
+    
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ETagCacheTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that revalidates repeat GETs with If-None-Match.
+    
+    GitHub doesn't count 304 Not Modified against the rate limit, so a repeat
+    fetch of an unchanged PR, check list, or review list costs nothing. On a
+    304 the stored body is returned as a 200.
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        # (url, authorization) -> (etag, headers, body); insertion order = age
+        self._entries: dict[tuple[str, str], tuple[str, list[tuple[str, str]], bytes]] = {}
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+        
+        # Key on the credentials too so one token never sees another's data
+        key = (str(request.url), request.headers.get("authorization", ""))
+        cached = self._entries.get(key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+        
+        response = await self._transport.handle_async_request(request)
+        
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            self._entries[key] = self._entries.pop(key)  # Mark as recently used
+            return httpx.Response(200, headers=cached[1], content=cached[2], request=request)
+        
+        etag = response.headers.get("etag")
+        if response.status_code == 200 and etag:
+            body = await response.aread()
+            headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _ENCODING_HEADERS]
+            self._entries.pop(key, None)
+            self._entries[key] = (etag, headers, body)
+            if len(self._entries) > _MAX_ETAG_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+        return response
+    
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Client name -> (event loop it was created on, client)
+_clients: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _retire_client(name: str, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Close a replaced client on the loop that owns its connections."""
+    if client.is_closed:
+        return
+    if loop.is_closed():
+        # Its connections went away with the loop; nothing left to close them on
+        logger.debug(f"Dropped {name} HTTP client from a closed event loop")
+        return
+    
+    def _log_failure(future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Error closing replaced {name} HTTP client: {future.exception()}")
+    
+    # Runs now if that loop is running in another thread, or when it next runs
+    coro = client.aclose()
+    try:
+        asyncio.run_coroutine_threadsafe(coro, loop).add_done_callback(_log_failure)
+    except RuntimeError:
+        coro.close()  # The loop closed in the meantime
+
+
+def _get_client(name: str, transport_factory: Callable[[], httpx.AsyncBaseTransport] | None = None, **kwargs) -> httpx.AsyncClient:
+    """Return the named client, creating it if missing, closed, or bound to another loop."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(name)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        # Pooled connections belong to the loop that opened them, so a client
+        # can't be shared across loops (e.g. the scheduler's fallback loop)
+        if entry is not None:
+            _retire_client(name, *entry)
+        if transport_factory is not None:
+            kwargs["transport"] = transport_factory()
+        client = httpx.AsyncClient(timeout=30.0, http2=True, limits=_LIMITS, **kwargs)
+        _clients[name] = (loop, client)
+        logger.debug(f"Created shared {name} HTTP client")
+        return client
+    return entry[1]
+
+
+def _github_transport() -> httpx.AsyncBaseTransport:
+    return _ETagCacheTransport(
+        _GitHubThrottleTransport(httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS))
+    )
+
+
+def get_github_client() -> httpx.AsyncClient:
+    """Get the shared GitHub API client (throttled to GitHub's rate limits, with ETag revalidation)."""
+    return _get_client("github", transport_factory=_github_transport, base_url="https://api.github.com")
+
+
+def get_jira_client() -> httpx.AsyncClient:
+    """Get the shared Jira API client."""
+    return _get_client("jira")
+
+
+def get_slack_client() -> httpx.AsyncClient:
+    """Get the shared Slack Web API client."""
+    return _get_client("slack", base_url="https://slack.com/api")
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients (call on shutdown)."""
+    for name, (_, client) in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing {name} HTTP client: {e}")
+    _clients.clear()
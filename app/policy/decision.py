@@ -4,6 +4,8 @@ Decision engine - Routes actions based on scores and context.
 This is the core intelligence layer that decides what to do.
 """
 
+from datetime import datetime
+from itertools import product
 from typing import Optional
 from app.policy.models import TaskContext, Action, DecisionTrace
 from app.policy.scoring import (
@@ -13,10 +15,72 @@ from app.policy.scoring import (
 from app.policy.rules import check_guardrails
 
 
+def _cs_bucket(cs: float) -> int:
+    """Criticality bucket: 0 (<40), 1 (40-60), 2 (60-80], 3 (>80)."""
+    if cs < 40:
+        return 0
+    if cs <= 60:
+        return 1
+    return 2 if cs <= 80 else 3
+
+
+def _route(
+    cs_bucket: int,
+    afs_high: bool,
+    user_available: bool,
+    automation_enabled: bool
+) -> tuple[Action, tuple[str, ...]]:
+    """
+    The decision policy for one bucket combination.
+    
+    Returns the action and its reasoning templates ({cs}/{afs} are filled in
+    per call). AUTOMATE still has to pass guardrails in decide_action.
+    """
+    # High criticality + user available → Execute directly
+    if cs_bucket == 3 and user_available:
+        return Action.EXECUTE, ("High criticality (CS: {cs:.1f})", "User is available", "Execute directly")
+    
+    # High criticality + user unavailable → Delegate
+    # (teammate selection happens in the conversation agent)
+    if cs_bucket >= 2 and not user_available:
+        return Action.DELEGATE, ("High criticality (CS: {cs:.1f})", "User is unavailable", "Delegate to best teammate")
+    
+    # High criticality + high AFS + automation enabled → Consider automation
+    if cs_bucket >= 2 and afs_high and automation_enabled:
+        return Action.AUTOMATE, (
+            "High criticality (CS: {cs:.1f})",
+            "High automation feasibility (AFS: {afs:.1f})",
+            "Guardrails passed",
+            "Safe to automate"
+        )
+    
+    # Low criticality → Summarize for later
+    if cs_bucket == 0:
+        return Action.SUMMARIZE, ("Low criticality (CS: {cs:.1f})", "Summarize and batch for later")
+    
+    # Medium criticality + user unavailable → Reschedule
+    if cs_bucket == 1 and not user_available:
+        return Action.RESCHEDULE, (
+            "Medium criticality (CS: {cs:.1f})",
+            "User is unavailable",
+            "Reschedule for when user is available"
+        )
+    
+    # Default: Notify
+    return Action.NOTIFY, ("Criticality: {cs:.1f}", "Notify user/team")
+
+
+# (cs bucket, AFS >= 70, user available, automation enabled) -> (action, reasoning templates)
+_DECISION_TABLE: dict[tuple[int, bool, bool, bool], tuple[Action, tuple[str, ...]]] = {
+    key: _route(*key) for key in product(range(4), (False, True), (False, True), (False, True))
+}
+
+
 def decide_action(
     context: TaskContext,
     user_available: bool,
-    automation_enabled: bool = False
+    automation_enabled: bool = False,
+    now: Optional[datetime] = None
 ) -> DecisionTrace:
     """
     Decide what action to take based on context and scores.
@@ -33,12 +97,13 @@ def decide_action(
         context: Task context
         user_available: Whether user is available
         automation_enabled: Whether user has opted into automation
+        now: Current UTC time, shared across a batch of decisions (optional)
     
     Returns:
         DecisionTrace with action and reasoning
     """
     # Calculate scores
-    cs = calculate_criticality_score(context)
+    cs = calculate_criticality_score(context, now)
     afs = calculate_automation_feasibility_score(context)
     
     # Build factors dict for trace
@@ -52,81 +117,47 @@ def decide_action(
     }
     
     # Decision logic
-    action = Action.NOTIFY
-    reasoning_parts = []
-    selected_teammate = None
-    
-    # High criticality + user available → Execute directly
-    if cs > 80 and user_available:
-        action = Action.EXECUTE
-        reasoning_parts.append(f"High criticality (CS: {cs:.1f})")
-        reasoning_parts.append("User is available")
-        reasoning_parts.append("Execute directly")
-    
-    # High criticality + user unavailable → Delegate
-    elif cs > 60 and not user_available:
-        action = Action.DELEGATE
-        reasoning_parts.append(f"High criticality (CS: {cs:.1f})")
-        reasoning_parts.append("User is unavailable")
-        reasoning_parts.append("Delegate to best teammate")
-        # Teammate selection will happen in conversation agent
-        selected_teammate = None  # Will be set during delegation execution
+    action, templates = _DECISION_TABLE[(_cs_bucket(cs), afs >= 70, user_available, automation_enabled)]
+    reasoning_parts = None
+    selected_teammate = None  # Set during delegation execution
+    guardrail_result = None
     
-    # High criticality + high AFS + automation enabled → Consider automation
-    elif cs > 60 and afs >= 70 and automation_enabled:
+    if action == Action.AUTOMATE:
         # Check guardrails first
         guardrail_result = check_guardrails(
             Action.AUTOMATE,
             context,
             user_available,
-            automation_enabled
+            automation_enabled,
+            precomputed_afs=afs
         )
         
-        if guardrail_result.allowed:
-            action = Action.AUTOMATE
-            reasoning_parts.append(f"High criticality (CS: {cs:.1f})")
-            reasoning_parts.append(f"High automation feasibility (AFS: {afs:.1f})")
-            reasoning_parts.append("Guardrails passed")
-            reasoning_parts.append("Safe to automate")
-        else:
+        if not guardrail_result.allowed:
             # Fallback to delegate if automation not safe
             action = Action.DELEGATE
-            reasoning_parts.append(f"High criticality (CS: {cs:.1f})")
-            reasoning_parts.append("Automation not safe")
-            reasoning_parts.append(guardrail_result.reason)
-            reasoning_parts.append("Delegate instead")
-            selected_teammate = None  # Will be set during delegation execution
-    
-    # Low criticality → Summarize for later
-    elif cs < 40:
-        action = Action.SUMMARIZE
-        reasoning_parts.append(f"Low criticality (CS: {cs:.1f})")
-        reasoning_parts.append("Summarize and batch for later")
-    
-    # Medium criticality + user unavailable → Reschedule
-    elif 40 <= cs <= 60 and not user_available:
-        action = Action.RESCHEDULE
-        reasoning_parts.append(f"Medium criticality (CS: {cs:.1f})")
-        reasoning_parts.append("User is unavailable")
-        reasoning_parts.append("Reschedule for when user is available")
-    
-    # Default: Notify
-    else:
-        action = Action.NOTIFY
-        reasoning_parts.append(f"Criticality: {cs:.1f}")
-        reasoning_parts.append("Notify user/team")
+            reasoning_parts = [
+                f"High criticality (CS: {cs:.1f})",
+                "Automation not safe",
+                guardrail_result.reason,
+                "Delegate instead"
+            ]
     
+    if reasoning_parts is None:
+        reasoning_parts = [template.format(cs=cs, afs=afs) for template in templates]
     reasoning = ". ".join(reasoning_parts)
     
     # Get guardrail checks if applicable
     guardrail_checks = None
     if action in [Action.AUTOMATE, Action.EXECUTE]:
-        guardrail_result = check_guardrails(
-            action,
-            context,
-            user_available,
-            automation_enabled
-        )
+        # AUTOMATE already ran its guardrails above
+        if action != Action.AUTOMATE:
+            guardrail_result = check_guardrails(
+                action,
+                context,
+                user_available,
+                automation_enabled,
+                precomputed_afs=afs
+            )
         guardrail_checks = guardrail_result.checks
     
     return DecisionTrace(
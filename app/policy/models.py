@@ -1,10 +1,15 @@
 """Data models for policy engine."""
 
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 
 
+# Labels marking a task as touching production
+PRODUCTION_LABELS = frozenset({"production", "prod", "live", "main", "master"})
+
+
 class Action(str, Enum):
     """Possible actions the agent can take."""
     EXECUTE = "execute"  # User available, execute directly
@@ -27,8 +32,17 @@ class DecisionTrace(BaseModel):
     guardrail_checks: Optional[Dict[str, bool]] = None
 
 
-class TaskContext(BaseModel):
-    """Context about a task (PR, Jira issue, etc.)"""
+@dataclass(slots=True, frozen=True)
+class TaskContext:
+    """
+    Context about a task (PR, Jira issue, etc.)
+    
+    A plain slotted dataclass: the scoring functions read its fields many times
+    per decision, and the extract_task_context_* functions already normalize
+    the raw API data, so nothing is validated here. Frozen so derived values
+    can be precomputed (metadata stays a mutable dict).
+    """
+    
     # Task identification
     task_type: str  # "pr", "jira_issue", "calendar_event"
     task_id: str  # PR number, issue key, event ID
@@ -42,7 +56,7 @@ class TaskContext(BaseModel):
     size: Optional[str] = None  # "small", "medium", "large" for PRs
     age_days: Optional[float] = None
     due_date: Optional[str] = None
-    labels: list[str] = []
+    labels: list[str] = field(default_factory=list)
     
     # Automation feasibility factors
     ci_passed: Optional[bool] = None
@@ -52,5 +66,16 @@ class TaskContext(BaseModel):
     
     # Additional context
     assignee: Optional[str] = None
-    metadata: Dict[str, Any] = {}
-
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # Whether any label marks this task as touching production (derived)
+    is_production_labeled: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "is_production_labeled", not PRODUCTION_LABELS.isdisjoint(self.labels))
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Dict of the task's fields (same shape as the former Pydantic model_dump)."""
+        data = asdict(self)
+        del data["is_production_labeled"]
+        return data
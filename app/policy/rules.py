@@ -4,11 +4,25 @@ Guardrails and safety rules for automation.
 Ensures actions are safe before execution.
 """
 
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict
 from pydantic import BaseModel
 from app.policy.models import TaskContext, Action
 
 
+@lru_cache(maxsize=1)
+def _current_hour_bucket(minute_bucket: int) -> int:
+    """Local hour for a minute since the epoch; cached so it's computed once a minute."""
+    return datetime.now().hour
+
+
+def _current_hour() -> int:
+    """Current local hour, at most a minute stale."""
+    return _current_hour_bucket(int(time.time() // 60))
+
+
 class GuardrailResult(BaseModel):
     """Result of guardrail checks."""
     allowed: bool
@@ -20,7 +34,8 @@ def check_guardrails(
     action: Action,
     context: TaskContext,
     user_available: bool,
-    automation_enabled: bool = False
+    automation_enabled: bool = False,
+    precomputed_afs: Optional[float] = None
 ) -> GuardrailResult:
     """
     Check if an action is safe to execute.
@@ -30,6 +45,7 @@ def check_guardrails(
         context: Task context
         user_available: Whether user is available
         automation_enabled: Whether user has opted into automation
+        precomputed_afs: Automation feasibility score, if the caller already has it
     
     Returns:
         GuardrailResult with allowed status and reason
@@ -46,8 +62,10 @@ def check_guardrails(
     # Check 2: Critical actions require high scores
     if action == Action.AUTOMATE:
         # Only automate if AFS is high enough
-        from app.policy.scoring import calculate_automation_feasibility_score
-        afs = calculate_automation_feasibility_score(context)
+        afs = precomputed_afs
+        if afs is None:
+            from app.policy.scoring import calculate_automation_feasibility_score
+            afs = calculate_automation_feasibility_score(context)
         checks["high_afs"] = afs >= 70
         if afs < 70:
             reasons.append(f"Automation feasibility too low (AFS: {afs:.1f} < 70)")
@@ -55,12 +73,10 @@ def check_guardrails(
     # Check 3: Production safety
     if action == Action.AUTOMATE:
         # Check if this touches production
-        is_production = any(
-            label in ["production", "prod", "live", "main", "master"]
-            for label in context.labels
-        )
-        checks["production_safe"] = not is_production or context.approvals >= 2
-        if is_production and context.approvals < 2:
+        is_production = context.is_production_labeled
+        approvals = context.approvals or 0
+        checks["production_safe"] = not is_production or approvals >= 2
+        if is_production and approvals < 2:
             reasons.append("Production changes require 2+ approvals")
     
     # Check 4: CI must pass for automation
@@ -77,9 +93,7 @@ def check_guardrails(
     
     # Check 6: Business hours (for automation)
     if action == Action.AUTOMATE:
-        from datetime import datetime
-        now = datetime.now()
-        hour = now.hour
+        hour = _current_hour()
         # Business hours: 9 AM - 6 PM (adjust as needed)
         checks["business_hours"] = 9 <= hour < 18
         if not (9 <= hour < 18):
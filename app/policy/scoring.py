@@ -6,16 +6,85 @@ Calculates:
 - Automation Feasibility Score (AFS): How safe is it to automate?
 """
 
+import re
+import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from app.policy.models import TaskContext
 
+try:
+    from dateutil import parser as _dtparser
+except ImportError:
+    _dtparser = None
 
-def calculate_criticality_score(context: TaskContext) -> float:
+
+# fromisoformat accepts a trailing "Z" natively from Python 3.11
+_NEEDS_Z_FIXUP = sys.version_info < (3, 11)
+
+
+# Priority factor points (0-30); unknown priorities get 10
+_PRIORITY_SCORES = {
+    "highest": 30,
+    "high": 25,
+    "medium": 15,
+    "low": 5,
+    "lowest": 0,
+}
+
+# Due date factor points (0-25) by hours until due: overdue 25, <24h 20,
+# <48h 15, <1 week 10, later 0 (index with bisect_right)
+_DUE_HOURS = (0, 24, 48, 168)
+_DUE_SCORES = (25, 20, 15, 10, 0)
+
+# Age factor points (0-20) by days open: >7 20, >3 15, >1 10, else 0
+# (index with bisect_left so exact boundaries fall in the lower band)
+_AGE_DAYS = (1, 3, 7)
+_AGE_SCORES = (0, 10, 15, 20)
+
+# Labels containing any of these terms add urgency
+_URGENT_RE = re.compile(r"urgent|critical|blocker|hotfix|p0|p1", re.IGNORECASE)
+
+# PR size factor points (0-15); unknown sizes get 5
+_SIZE_SCORES = {
+    "large": 15,
+    "medium": 10,
+    "small": 5,
+}
+
+# (field, value) pairs that rule out automation outright: AFS is 0 if any match
+_AUTOMATION_HARD_FAILS = (
+    ("ci_passed", False),
+    ("has_blockers", True),
+)
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse a timestamp as an aware datetime (naive means UTC); None if invalid.
+    
+    ISO 8601 goes through the fast fromisoformat path. Anything else (e.g. a
+    Jira due date like "2025/01/15") falls back to dateutil when installed.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00') if _NEEDS_Z_FIXUP else value)
+    except (ValueError, AttributeError, TypeError):
+        if _dtparser is None or not isinstance(value, str):
+            return None
+        try:
+            parsed = _dtparser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def calculate_criticality_score(context: TaskContext, now: Optional[datetime] = None) -> float:
     """
     Calculate Criticality Score (CS) from 0-100.
     
-    Higher score = more critical/urgent.
+    Higher score = more critical/urgent. Pass now (UTC) to share one clock
+    reading across a batch of tasks.
     
     Factors:
     - Priority (High/Medium/Low)
@@ -25,74 +94,66 @@ def calculate_criticality_score(context: TaskContext) -> float:
     - Labels (e.g., "urgent", "blocker")
     - Status (blocked = more critical)
     """
+    now = now or datetime.now(timezone.utc)
+    # Re-scoring the same task is a cache hit; age is bucketed to 0.01 days, the
+    # clock to the minute, and text fields lowercased so repeat lookups match
+    return _criticality_score(
+        context.priority.lower() if context.priority else None,
+        context.due_date,
+        round(context.age_days, 2) if context.age_days else None,
+        context.size.lower() if context.size else None,
+        tuple(context.labels),
+        context.status.lower() if context.status else None,
+        int(now.timestamp() // 60)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _criticality_score(
+    priority: Optional[str],
+    due_date: Optional[str],
+    age_days: Optional[float],
+    size: Optional[str],
+    labels: tuple[str, ...],
+    status: Optional[str],
+    minute: int
+) -> float:
+    """
+    Criticality score for the given task fields at the given minute since the epoch.
+    
+    priority, size, and status are expected already lowercased.
+    """
     score = 50.0  # Base score
     
     # Priority factor (0-30 points)
-    priority_scores = {
-        "highest": 30,
-        "high": 25,
-        "medium": 15,
-        "low": 5,
-        "lowest": 0,
-    }
-    if context.priority:
-        priority_lower = context.priority.lower()
-        score += priority_scores.get(priority_lower, 10)
+    if priority:
+        score += _PRIORITY_SCORES.get(priority, 10)
     
     # Due date factor (0-25 points)
-    if context.due_date:
-        try:
-            due = datetime.fromisoformat(context.due_date.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            hours_until_due = (due - now).total_seconds() / 3600
-            
-            if hours_until_due < 0:
-                # Overdue - very critical
-                score += 25
-            elif hours_until_due < 24:
-                # Due within 24 hours
-                score += 20
-            elif hours_until_due < 48:
-                # Due within 48 hours
-                score += 15
-            elif hours_until_due < 168:  # 1 week
-                # Due within a week
-                score += 10
-        except (ValueError, AttributeError):
-            pass
+    due = _parse_iso(due_date) if due_date else None
+    if due is not None:
+        now = datetime.fromtimestamp(minute * 60, timezone.utc)
+        hours_until_due = (due - now).total_seconds() / 3600
+        score += _DUE_SCORES[bisect_right(_DUE_HOURS, hours_until_due)]
     
     # Age factor (0-20 points)
     # Older tasks that aren't done become more critical
-    if context.age_days:
-        if context.age_days > 7:
-            score += 20
-        elif context.age_days > 3:
-            score += 15
-        elif context.age_days > 1:
-            score += 10
+    if age_days:
+        score += _AGE_SCORES[bisect_left(_AGE_DAYS, age_days)]
     
     # Size factor for PRs (0-15 points)
-    if context.size:
-        size_scores = {
-            "large": 15,
-            "medium": 10,
-            "small": 5,
-        }
-        score += size_scores.get(context.size.lower(), 5)
+    if size:
+        score += _SIZE_SCORES.get(size, 5)
     
     # Label factor (0-10 points)
-    urgent_labels = ["urgent", "critical", "blocker", "hotfix", "p0", "p1"]
-    for label in context.labels:
-        if any(urgent in label.lower() for urgent in urgent_labels):
-            score += 10
-            break
+    if any(_URGENT_RE.search(label) for label in labels):
+        score += 10
     
     # Status factor (0-10 points)
-    if context.status:
-        status_lower = context.status.lower()
-        if "blocked" in status_lower or "stuck" in status_lower:
+    if status:
+        if "blocked" in status or "stuck" in status:
             score += 10
-        elif "in progress" in status_lower:
+        elif "in progress" in status:
             score += 5
     
     # Cap at 100
@@ -111,14 +172,19 @@ def calculate_automation_feasibility_score(context: TaskContext) -> float:
     - Blockers (none = safer)
     - Mergeable status
     - Task type (some are safer than others)
+    
+    Failed CI or known blockers (_AUTOMATION_HARD_FAILS) score 0 outright,
+    whatever the other factors.
     """
+    for field_name, value in _AUTOMATION_HARD_FAILS:
+        if getattr(context, field_name) is value:
+            return 0.0
+    
     score = 0.0
     
     # CI status (0-30 points)
     if context.ci_passed is True:
         score += 30
-    elif context.ci_passed is False:
-        score += 0  # Don't automate if CI failed
     else:
         score += 15  # Unknown CI status
     
@@ -134,8 +200,6 @@ def calculate_automation_feasibility_score(context: TaskContext) -> float:
     # Blockers (0-20 points)
     if context.has_blockers is False:
         score += 20
-    elif context.has_blockers is True:
-        score += 0  # Don't automate if blocked
     else:
         score += 10  # Unknown
     
@@ -158,21 +222,18 @@ def calculate_automation_feasibility_score(context: TaskContext) -> float:
     return min(score, 100.0)
 
 
-def extract_task_context_from_pr(pr_data: dict) -> TaskContext:
-    """Extract TaskContext from PR data."""
+def extract_task_context_from_pr(pr_data: dict, now: Optional[datetime] = None) -> TaskContext:
+    """Extract TaskContext from PR data (now: shared UTC clock reading for batches)."""
     context_summary = pr_data.get("context_summary", {})
     pr_detail = pr_data.get("pr", {})
     
     # Calculate age
     created = pr_detail.get("created_at")
+    created_dt = _parse_iso(created) if created else None
     age_days = None
-    if created:
-        try:
-            created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            age_days = (now - created_dt).total_seconds() / 86400
-        except (ValueError, AttributeError):
-            pass
+    if created_dt is not None:
+        now = now or datetime.now(timezone.utc)
+        age_days = (now - created_dt).total_seconds() / 86400
     
     return TaskContext(
         task_type="pr",
@@ -181,7 +242,7 @@ def extract_task_context_from_pr(pr_data: dict) -> TaskContext:
         status=pr_detail.get("state", ""),
         size=context_summary.get("pr_size"),
         age_days=age_days,
-        labels=pr_detail.get("labels", []),
+        labels=pr_detail.get("labels") or [],
         ci_passed=context_summary.get("ci_passed"),
         approvals=context_summary.get("approvals", 0),
         has_blockers=context_summary.get("has_blockers", False),
@@ -191,22 +252,19 @@ def extract_task_context_from_pr(pr_data: dict) -> TaskContext:
     )
 
 
-def extract_task_context_from_jira(issue_data: dict) -> TaskContext:
-    """Extract TaskContext from Jira issue data."""
+def extract_task_context_from_jira(issue_data: dict, now: Optional[datetime] = None) -> TaskContext:
+    """Extract TaskContext from Jira issue data (now: shared UTC clock reading for batches)."""
     # Handle both dict and Pydantic model
     if hasattr(issue_data, 'model_dump'):
         issue_data = issue_data.model_dump()
     
     # Calculate age
     created = issue_data.get("created")
+    created_dt = _parse_iso(created) if created else None
     age_days = None
-    if created:
-        try:
-            created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            age_days = (now - created_dt).total_seconds() / 86400
-        except (ValueError, AttributeError, TypeError):
-            pass
+    if created_dt is not None:
+        now = now or datetime.now(timezone.utc)
+        age_days = (now - created_dt).total_seconds() / 86400
     
     # Get due time
     due_time = issue_data.get("due_time")
@@ -219,7 +277,7 @@ def extract_task_context_from_jira(issue_data: dict) -> TaskContext:
         status=issue_data.get("status"),
         age_days=age_days,
         due_date=due_time,
-        labels=issue_data.get("labels", []),
+        labels=issue_data.get("labels") or [],
         assignee=issue_data.get("assignee"),
         metadata={"issue_data": issue_data}
     )
@@ -7,36 +7,83 @@ Exposes Jira and GitHub tools via Model Context Protocol (MCP).
 import sys
 import os
 from pathlib import Path
-
-# Add project root to path so 'app' module can be found
-# Handle both direct execution and module execution
-try:
-    # Try to get project root from this file's location
-    if __file__:
-        project_root = Path(__file__).resolve().parent.parent
-    else:
-        # Fallback: assume we're in the project root
-        project_root = Path.cwd()
-except:
-    # Ultimate fallback
-    project_root = Path.cwd()
-
-# Ensure project root is in path
-project_root_str = str(project_root.resolve())
-if project_root_str not in sys.path:
-    sys.path.insert(0, project_root_str)
-
-from fastmcp import FastMCP
 from dotenv import load_dotenv
 
-# Load environment variables
-env_path = project_root / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+# Make 'app' importable when run as a script, and load .env before importing it
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+if (_ROOT / ".env").exists():
+    load_dotenv(_ROOT / ".env")
 else:
-    # Try loading from current directory as fallback
+    # Fall back to searching from the current directory
     load_dotenv()
 
+from fastmcp import FastMCP
+from pydantic import TypeAdapter
+from app.agno_tools.cache import cached_tool, invalidate_tool_cache
+from app.tools.jira import (
+    get_projects,
+    get_boards,
+    get_board_issues,
+    get_jira_issues as fetch_jira_issues,
+    get_single_issue,
+    get_fields,
+    create_issue,
+    update_issue,
+    find_user_by_name,
+    JiraProject,
+    JiraBoard,
+    JiraIssue,
+    JiraIssueDetail,
+    JiraField,
+)
+from app.tools.github import (
+    get_repo,
+    get_pull_requests,
+    get_pull_request,
+    get_pr_checks,
+    get_pr_reviews,
+    get_pr_context,
+    get_recent_commits,
+    create_pull_request,
+    update_pull_request,
+    update_pr_assignees,
+    update_pr_labels,
+    request_pr_review,
+    GitHubPR,
+    GitHubReview,
+    GitHubCommit,
+)
+from app.tools.calendar import (
+    list_calendars as fetch_calendars,
+    get_events,
+    get_today_events as fetch_today_events,
+    get_availability,
+    get_this_week_availability as fetch_this_week_availability,
+    CalendarEvent,
+)
+
+# List results are dumped through one adapter per model: a single schema walk
+# per call instead of one model_dump per item
+_JIRA_PROJECTS = TypeAdapter(list[JiraProject])
+_JIRA_BOARDS = TypeAdapter(list[JiraBoard])
+_JIRA_ISSUES = TypeAdapter(list[JiraIssue])
+_JIRA_ISSUE_DETAILS = TypeAdapter(list[JiraIssueDetail])
+_JIRA_FIELDS = TypeAdapter(list[JiraField])
+_GITHUB_PRS = TypeAdapter(list[GitHubPR])
+_GITHUB_REVIEWS = TypeAdapter(list[GitHubReview])
+_GITHUB_COMMITS = TypeAdapter(list[GitHubCommit])
+_CALENDAR_EVENTS = TypeAdapter(list[CalendarEvent])
+
+# Read-tool cache lifetimes (seconds); a stale result is served at most this
+# much longer while it refreshes. Lists change rarely, single items are polled.
+_LIST_TTL = 60
+_DETAIL_TTL = 10
+
+# Upper bound on max_results for Jira list tools (the model picks the value)
+_MAX_JIRA_RESULTS = 500
+
 # Create MCP server
 mcp = FastMCP(
     name="continuum.ai",
@@ -59,48 +106,50 @@ mcp = FastMCP(
 # =============================================================================
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_jira_projects() -> list[dict]:
     """
     List all accessible Jira projects.
     
     Returns a list of projects with id, key, name, and project_type.
     """
-    from app.tools.jira import get_projects
     projects = await get_projects()
-    return [p.model_dump() for p in projects]
+    return _JIRA_PROJECTS.dump_python(projects)
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_jira_boards() -> list[dict]:
     """
     List all accessible Jira boards (Scrum/Kanban).
     
     Returns a list of boards with id, name, board_type, and project_key.
     """
-    from app.tools.jira import get_boards
     boards = await get_boards()
-    return [b.model_dump() for b in boards]
+    return _JIRA_BOARDS.dump_python(boards)
 
 
 @mcp.tool
-async def get_jira_board_issues(board_id: int) -> list[dict]:
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
+async def get_jira_board_issues(board_id: int, max_results: int = 50) -> list[dict]:
     """
-    Get all issues from a specific Jira board with full details.
+    Get issues from a specific Jira board with full details.
     
     Args:
         board_id: The ID of the Jira board
+        max_results: Maximum number of issues to return (default 50, at most 500)
         
     Returns:
         List of issues with key, summary, status, priority, assignee,
         description, issue_type, labels, components, created, updated, due_time.
     """
-    from app.tools.jira import get_board_issues
-    issues = await get_board_issues(board_id)
-    return [i.model_dump() for i in issues]
+    issues = await get_board_issues(board_id, max_results=min(max(max_results, 1), _MAX_JIRA_RESULTS))
+    return _JIRA_ISSUE_DETAILS.dump_python(issues)
 
 
 @mcp.tool
-async def get_jira_issues(jql: str = "ORDER BY created DESC") -> list[dict]:
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
+async def get_jira_issues(jql: str = "ORDER BY created DESC", max_results: int = 50) -> list[dict]:
     """
     Fetch Jira issues using JQL (Jira Query Language).
     
@@ -109,16 +158,17 @@ async def get_jira_issues(jql: str = "ORDER BY created DESC") -> list[dict]:
              - "assignee=currentUser()"
              - "project=PROJ AND status!=Done"
              - "priority=High ORDER BY created DESC"
+        max_results: Maximum number of issues to return (default 50, at most 500)
              
     Returns:
         List of issues matching the query.
     """
-    from app.tools.jira import get_jira_issues as fetch_issues
-    issues = await fetch_issues(jql)
-    return [i.model_dump() for i in issues]
+    issues = await fetch_jira_issues(jql, max_results=min(max(max_results, 1), _MAX_JIRA_RESULTS))
+    return _JIRA_ISSUES.dump_python(issues)
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_DETAIL_TTL, swr_seconds=_DETAIL_TTL)
 async def get_jira_issue(issue_key: str) -> dict:
     """
     Fetch a single Jira issue by its key.
@@ -129,12 +179,12 @@ async def get_jira_issue(issue_key: str) -> dict:
     Returns:
         Full issue details including labels, components, timestamps.
     """
-    from app.tools.jira import get_single_issue
     issue = await get_single_issue(issue_key)
     return issue.model_dump()
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_jira_fields(search: str | None = None) -> list[dict]:
     """
     List all Jira fields. Useful for finding custom field IDs.
@@ -145,9 +195,8 @@ async def get_jira_fields(search: str | None = None) -> list[dict]:
     Returns:
         List of fields with id, name, field_type, and is_custom.
     """
-    from app.tools.jira import get_fields
     fields = await get_fields(search)
-    return [f.model_dump() for f in fields]
+    return _JIRA_FIELDS.dump_python(fields)
 
 
 @mcp.tool
@@ -177,7 +226,6 @@ async def create_jira_issue(
     Returns:
         Created Jira issue details
     """
-    from app.tools.jira import create_issue
     issue = await create_issue(
         project_key=project_key,
         summary=summary,
@@ -188,6 +236,7 @@ async def create_jira_issue(
         priority=priority,
         labels=labels
     )
+    invalidate_tool_cache("get_jira")
     return issue.model_dump()
 
 
@@ -218,7 +267,6 @@ async def update_jira_issue(
     Returns:
         Updated Jira issue details
     """
-    from app.tools.jira import update_issue
     issue = await update_issue(
         issue_key=issue_key,
         summary=summary,
@@ -229,6 +277,7 @@ async def update_jira_issue(
         status=status,
         labels=labels
     )
+    invalidate_tool_cache("get_jira")
     return issue.model_dump()
 
 
@@ -243,7 +292,6 @@ async def find_jira_user(name: str) -> dict | None:
     Returns:
         User dict with accountId, displayName, emailAddress, or None if not found
     """
-    from app.tools.jira import find_user_by_name
     user = await find_user_by_name(name)
     return user
 
@@ -253,6 +301,7 @@ async def find_jira_user(name: str) -> dict | None:
 # =============================================================================
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_github_repo() -> dict:
     """
     Get information about the configured GitHub repository.
@@ -261,12 +310,12 @@ async def get_github_repo() -> dict:
         Repository details including name, description, default_branch,
         and open_issues_count.
     """
-    from app.tools.github import get_repo
     repo = await get_repo()
     return repo.model_dump()
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_github_pulls(state: str = "open") -> list[dict]:
     """
     List pull requests from the configured repository.
@@ -277,12 +326,12 @@ async def get_github_pulls(state: str = "open") -> list[dict]:
     Returns:
         List of PRs with number, title, state, draft status, user, and timestamps.
     """
-    from app.tools.github import get_pull_requests
     prs = await get_pull_requests(state=state)
-    return [pr.model_dump() for pr in prs]
+    return _GITHUB_PRS.dump_python(prs)
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_DETAIL_TTL, swr_seconds=_DETAIL_TTL)
 async def get_github_pull(pr_number: int) -> dict:
     """
     Get detailed information about a specific pull request.
@@ -294,12 +343,12 @@ async def get_github_pull(pr_number: int) -> dict:
         Full PR details including additions, deletions, changed_files,
         pr_size (small/medium/large), mergeable status, and branch info.
     """
-    from app.tools.github import get_pull_request
     pr = await get_pull_request(pr_number)
     return pr.model_dump()
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_DETAIL_TTL, swr_seconds=_DETAIL_TTL)
 async def get_github_pr_checks(pr_number: int) -> dict:
     """
     Get CI/CD check status for a pull request.
@@ -311,12 +360,12 @@ async def get_github_pr_checks(pr_number: int) -> dict:
         Check status with total_count, overall conclusion 
         (success/failure/pending), and individual check details.
     """
-    from app.tools.github import get_pr_checks
     checks = await get_pr_checks(pr_number)
     return checks.model_dump()
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_DETAIL_TTL, swr_seconds=_DETAIL_TTL)
 async def get_github_pr_reviews(pr_number: int) -> list[dict]:
     """
     Get reviews for a pull request.
@@ -328,12 +377,12 @@ async def get_github_pr_reviews(pr_number: int) -> list[dict]:
         List of reviews with user, state (APPROVED/CHANGES_REQUESTED/COMMENTED),
         and submitted_at timestamp.
     """
-    from app.tools.github import get_pr_reviews
     reviews = await get_pr_reviews(pr_number)
-    return [r.model_dump() for r in reviews]
+    return _GITHUB_REVIEWS.dump_python(reviews)
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_DETAIL_TTL, swr_seconds=_DETAIL_TTL)
 async def get_github_pr_context(pr_number: int) -> dict:
     """
     Get comprehensive PR context for agent decision-making.
@@ -359,11 +408,11 @@ async def get_github_pr_context(pr_number: int) -> dict:
           - approvals
           - has_blockers
     """
-    from app.tools.github import get_pr_context
     return await get_pr_context(pr_number)
 
 
 @mcp.tool
+@cached_tool(ttl_seconds=_LIST_TTL, swr_seconds=_LIST_TTL)
 async def get_github_commits(author: str | None = None, per_page: int = 10) -> list[dict]:
     """
     Get recent commits from the repository.
@@ -375,9 +424,8 @@ async def get_github_commits(author: str | None = None, per_page: int = 10) -> l
     Returns:
         List of commits with sha, message, author, date, and html_url.
     """
-    from app.tools.github import get_recent_commits
     commits = await get_recent_commits(author=author, per_page=per_page)
-    return [c.model_dump() for c in commits]
+    return _GITHUB_COMMITS.dump_python(commits)
 
 
 @mcp.tool
@@ -399,13 +447,13 @@ async def create_github_pr(
     Returns:
         Created PR details
     """
-    from app.tools.github import create_pull_request
     pr = await create_pull_request(
         title=title,
         body=body,
         head=head,
         base=base
     )
+    invalidate_tool_cache("get_github_p")
     return pr.model_dump()
 
 
@@ -432,7 +480,6 @@ async def update_github_pr(
     Returns:
         Updated PR details
     """
-    from app.tools.github import update_pull_request
     pr = await update_pull_request(
         pr_number=pr_number,
         title=title,
@@ -441,6 +488,7 @@ async def update_github_pr(
         state=state,
         base=base
     )
+    invalidate_tool_cache("get_github_p")
     return pr.model_dump()
 
 
@@ -461,12 +509,13 @@ async def update_github_pr_assignees(
     Returns:
         Updated assignees list with added/removed info
     """
-    from app.tools.github import update_pr_assignees
-    return await update_pr_assignees(
+    result = await update_pr_assignees(
         pr_number=pr_number,
         assignees=assignees,
         remove_assignees=remove_assignees
     )
+    invalidate_tool_cache("get_github_p")
+    return result
 
 
 @mcp.tool
@@ -486,12 +535,13 @@ async def update_github_pr_labels(
     Returns:
         Updated labels list with added/removed info
     """
-    from app.tools.github import update_pr_labels
-    return await update_pr_labels(
+    result = await update_pr_labels(
         pr_number=pr_number,
         labels=labels,
         remove_labels=remove_labels
     )
+    invalidate_tool_cache("get_github_p")
+    return result
 
 
 @mcp.tool
@@ -511,12 +561,28 @@ async def request_github_pr_review(
     Returns:
         Review request result with requested reviewers and teams
     """
-    from app.tools.github import request_pr_review
-    return await request_pr_review(
+    result = await request_pr_review(
         pr_number=pr_number,
         reviewers=reviewers,
         team_reviewers=team_reviewers
     )
+    invalidate_tool_cache("get_github_p")
+    return result
+
+
+@mcp.tool
+async def clear_tool_cache(prefix: str = "") -> dict:
+    """
+    Drop cached Jira/GitHub read results so the next call refetches.
+    
+    Args:
+        prefix: Only clear tools whose name starts with this (e.g. "get_github"); empty clears all
+    
+    Returns:
+        Confirmation with the prefix that was cleared
+    """
+    invalidate_tool_cache(prefix)
+    return {"success": True, "cleared": prefix or "all"}
 
 
 # =============================================================================
@@ -533,7 +599,6 @@ async def list_calendars() -> list[dict]:
     Returns:
         List of calendars with id, summary, description, and primary flag.
     """
-    from app.tools.calendar import list_calendars as fetch_calendars
     return await fetch_calendars()
 
 
@@ -557,9 +622,8 @@ async def get_calendar_events(
     Returns:
         List of events with id, summary, start, end, description, location, attendees.
     """
-    from app.tools.calendar import get_events
     events = await get_events(start_date, end_date, calendar_id)
-    return [e.model_dump() for e in events]
+    return _CALENDAR_EVENTS.dump_python(events)
 
 
 @mcp.tool
@@ -573,9 +637,8 @@ async def get_today_events(calendar_id: str = "primary") -> list[dict]:
     Returns:
         List of today's events.
     """
-    from app.tools.calendar import get_today_events
-    events = await get_today_events(calendar_id)
-    return [e.model_dump() for e in events]
+    events = await fetch_today_events(calendar_id)
+    return _CALENDAR_EVENTS.dump_python(events)
 
 
 @mcp.tool
@@ -605,7 +668,6 @@ async def get_calendar_availability(
         - busy_hours: Total hours blocked by events
         - free_hours: Total hours available for scheduling
     """
-    from app.tools.calendar import get_availability
     availability = await get_availability(
         start_date, end_date, calendar_id, work_hours_start, work_hours_end
     )
@@ -631,8 +693,7 @@ async def get_this_week_availability(
     Returns:
         Availability with events and free slots for the week.
     """
-    from app.tools.calendar import get_this_week_availability
-    availability = await get_this_week_availability(calendar_id, work_hours_start, work_hours_end)
+    availability = await fetch_this_week_availability(calendar_id, work_hours_start, work_hours_end)
     return availability.model_dump()
 
 
@@ -666,7 +727,7 @@ if __name__ == "__main__":
     
     if args.transport == "http":
         # Ensure we're in the project root directory
-        os.chdir(project_root)
+        os.chdir(_ROOT)
         
         print(f"🚀 Starting continuum.ai MCP Server (HTTP)")
         print(f"   Host: {args.host}")
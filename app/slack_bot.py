@@ -40,13 +40,15 @@ else:
     logger.error("SLACK_BOT_TOKEN not found in environment!")
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import httpx
+import orjson
 import asyncio
 from typing import List, Dict
 from app.agent.conversation import ConversationalAgent
-from app.agno_agent import AgnoAgent, should_use_agno
+from app.agno_agent import AgnoAgent
+from app.agno_router import should_use_agno
 from app.slack_features import (
     generate_standup_summary,
     summarize_pr,
@@ -77,18 +79,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Could not start trigger scheduler: {e}")
     
+    from app.agno_tools.cache import periodic_cleanup
+    cache_sweeper = asyncio.create_task(periodic_cleanup(300))
+    
     yield
     
     # Shutdown
+    cache_sweeper.cancel()
     try:
         from app.triggers.scheduler import stop_scheduler
         stop_scheduler()
         logger.info("Trigger system scheduler stopped")
     except Exception as e:
         logger.warning(f"Error stopping trigger scheduler: {e}")
+    
+    from app.http_clients import close_http_clients
+    await close_http_clients()
 
 
-app = FastAPI(title="continuum.ai Slack Bot", lifespan=lifespan)
+app = FastAPI(title="continuum.ai Slack Bot", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Initialize agents (lazy initialization)
 agent: Optional[ConversationalAgent] = None
@@ -176,7 +185,7 @@ async def post_to_slack(
                 response = await client.post(
                     "https://slack.com/api/chat.postMessage",
                     headers=headers,
-                    json=payload
+                    content=orjson.dumps(payload)
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -229,7 +238,7 @@ async def update_slack_message(channel: str, ts: str, text: str, blocks: Optiona
             response = await client.post(
                 "https://slack.com/api/chat.update",
                 headers=headers,
-                json=payload
+                content=orjson.dumps(payload)
             )
             response.raise_for_status()
             result = response.json()
@@ -257,7 +266,7 @@ async def slack_events(request: Request):
     if data.get("type") == "url_verification":
         challenge = data.get("challenge")
         logger.info(f"URL verification challenge: {challenge}")
-        return JSONResponse(content={"challenge": challenge})
+        return ORJSONResponse(content={"challenge": challenge})
     
     # Event handling
     if data.get("type") == "event_callback":
@@ -271,18 +280,18 @@ async def slack_events(request: Request):
         # Deduplication: Check if we've already processed this event
         if event_id and event_id in processed_events:
             logger.info(f"Event {event_id} already processed, skipping")
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         
         # Ignore bot messages (check both bot_id and user to prevent self-responses)
         if event.get("bot_id"):
             logger.info("Ignoring bot message (has bot_id)")
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         
         # Get bot user ID to check if message is from ourselves
         bot_user_id = data.get("authorizations", [{}])[0].get("user_id")
         if event.get("user") == bot_user_id:
             logger.info("Ignoring message from bot user")
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         
         # Handle app mentions and direct messages
         if event_type == "app_mention" or event_type == "message":
@@ -314,7 +323,7 @@ async def slack_events(request: Request):
             
             if not user_message:
                 logger.info("Empty message after cleaning")
-                return JSONResponse(content={"status": "ok"})
+                return ORJSONResponse(content={"status": "ok"})
             
             # Post instant acknowledgment
             ack_message = "💭 Got it! Processing your request..."
@@ -354,7 +363,7 @@ async def slack_events(request: Request):
                             await post_to_slack(channel, summary_response, thread_ts=thread_ts)
                     else:
                         await post_to_slack(channel, summary_response, thread_ts=thread_ts)
-                    return JSONResponse(content={"status": "ok"})
+                    return ORJSONResponse(content={"status": "ok"})
             
             # Process with agent - route Jira/GitHub requests to Agno, others to current agent
             try:
@@ -404,7 +413,7 @@ async def slack_events(request: Request):
                 except Exception as post_error:
                     logger.error(f"Failed to post error message: {post_error}", exc_info=True)
     
-    return JSONResponse(content={"status": "ok"})
+    return ORJSONResponse(content={"status": "ok"})
 
 
 @app.post("/slack/commands")
@@ -425,7 +434,7 @@ async def slack_commands(request: Request):
             # Default to board 1
             issues = await get_user_jira_issues(board_id=1)
             if not issues:
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": "✅ You have no open tasks!"
                 })
@@ -442,14 +451,14 @@ async def slack_commands(request: Request):
             # Add action buttons for first issue
             blocks = create_action_buttons(issue_key=issues[0].get("key") if issues else None)
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": "\n".join(lines),
                 "blocks": blocks
             })
         except Exception as e:
             logger.error(f"Error in /my-tasks: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error fetching tasks: {str(e)}"
             })
@@ -458,7 +467,7 @@ async def slack_commands(request: Request):
         try:
             prs = await get_user_prs()
             if not prs:
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": "✅ You have no open PRs!"
                 })
@@ -475,14 +484,14 @@ async def slack_commands(request: Request):
             # Add action buttons for first PR
             blocks = create_action_buttons(pr_number=prs[0].get("number") if prs else None)
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": "\n".join(lines),
                 "blocks": blocks
             })
         except Exception as e:
             logger.error(f"Error in /my-prs: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error fetching PRs: {str(e)}"
             })
@@ -490,13 +499,13 @@ async def slack_commands(request: Request):
     elif command == "/standup":
         try:
             summary = await generate_standup_summary(user_id)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": summary
             })
         except Exception as e:
             logger.error(f"Error in /standup: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error generating standup: {str(e)}"
             })
@@ -506,7 +515,7 @@ async def slack_commands(request: Request):
             # Get issues with "block" keyword
             issues = await get_jira_issues('summary ~ "block" OR description ~ "block" OR status = "Blocked"')
             if not issues:
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": "✅ No blockers found!"
                 })
@@ -516,13 +525,13 @@ async def slack_commands(request: Request):
                 lines.append(f"• `{issue.key}`: *{issue.summary}*")
                 lines.append(f"  Status: {issue.status} | Assignee: {issue.assignee or 'Unassigned'}")
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": "\n".join(lines)
             })
         except Exception as e:
             logger.error(f"Error in /blockers: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error fetching blockers: {str(e)}"
             })
@@ -530,13 +539,13 @@ async def slack_commands(request: Request):
     elif command == "/team-status":
         try:
             workload = await get_team_workload()
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "in_channel",
                 "text": workload
             })
         except Exception as e:
             logger.error(f"Error in /team-status: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error generating team status: {str(e)}"
             })
@@ -544,13 +553,13 @@ async def slack_commands(request: Request):
     elif command == "/suggestions":
         try:
             suggestions = await get_context_suggestions(user_id)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": suggestions
             })
         except Exception as e:
             logger.error(f"Error in /suggestions: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error generating suggestions: {str(e)}"
             })
@@ -600,13 +609,13 @@ async def slack_commands(request: Request):
             else:
                 lines.append("*Tasks:* No open tasks")
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": "\n".join(lines)
             })
         except Exception as e:
             logger.error(f"Error in /my-week: {e}", exc_info=True)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"❌ Error generating week overview: {str(e)}"
             })
@@ -614,7 +623,7 @@ async def slack_commands(request: Request):
     # Default /continuum command
     elif command == "/continuum" or not command:
         if not user_message:
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": "Usage: /continuum <your question>\n\nQuick commands:\n• /my-tasks - Your open Jira tasks\n• /my-prs - Your open PRs\n• /my-week - This week's calendar + tasks\n• /standup - Daily standup summary\n• /blockers - Blocked items\n• /team-status - Team workload\n• /suggestions - Context-aware suggestions"
             })
@@ -633,18 +642,18 @@ async def slack_commands(request: Request):
                 agent_instance = get_agent()
                 response = await agent_instance.chat(user_message)
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "in_channel",
                 "text": response
             })
         except Exception as e:
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "response_type": "ephemeral",
                 "text": f"Error: {str(e)}"
             })
     
     else:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "response_type": "ephemeral",
             "text": f"Unknown command: {command}"
         })
@@ -660,10 +669,9 @@ async def slack_interactions(request: Request):
         payload_str = form_data.get("payload")
         
         if not payload_str:
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         
-        import json
-        payload = json.loads(payload_str)
+        payload = orjson.loads(payload_str)
         action = payload.get("actions", [{}])[0]
         action_id = action.get("action_id")
         value = action.get("value", "")
@@ -679,18 +687,18 @@ async def slack_interactions(request: Request):
                 from app.agno_tools.jira_tools import update_jira_issue_tool
                 result = update_jira_issue_tool(issue_key, status="Done")
                 if result.get("success"):
-                    return JSONResponse(content={
+                    return ORJSONResponse(content={
                         "response_type": "ephemeral",
                         "text": f"✅ Marked {issue_key} as Done!"
                     })
                 else:
-                    return JSONResponse(content={
+                    return ORJSONResponse(content={
                         "response_type": "ephemeral",
                         "text": f"❌ Failed to update {issue_key}: {result.get('error')}"
                     })
             except Exception as e:
                 logger.error(f"Error marking done: {e}", exc_info=True)
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": f"❌ Error: {str(e)}"
                 })
@@ -703,18 +711,18 @@ async def slack_interactions(request: Request):
                 from app.agno_tools.jira_tools import update_jira_issue_tool
                 result = update_jira_issue_tool(issue_key, assignee="currentUser()")
                 if result.get("success"):
-                    return JSONResponse(content={
+                    return ORJSONResponse(content={
                         "response_type": "ephemeral",
                         "text": f"✅ Assigned {issue_key} to you!"
                     })
                 else:
-                    return JSONResponse(content={
+                    return ORJSONResponse(content={
                         "response_type": "ephemeral",
                         "text": f"❌ Failed to assign {issue_key}: {result.get('error')}"
                     })
             except Exception as e:
                 logger.error(f"Error assigning: {e}", exc_info=True)
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": f"❌ Error: {str(e)}"
                 })
@@ -724,22 +732,22 @@ async def slack_interactions(request: Request):
             try:
                 from app.agno_tools.github_tools import request_github_pr_review_tool
                 # Note: This requests review, actual approval would need GitHub API
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": f"✅ Approval action for PR #{pr_number} (requires GitHub integration)"
                 })
             except Exception as e:
                 logger.error(f"Error approving PR: {e}", exc_info=True)
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "response_type": "ephemeral",
                     "text": f"❌ Error: {str(e)}"
                 })
         
-        return JSONResponse(content={"status": "ok"})
+        return ORJSONResponse(content={"status": "ok"})
         
     except Exception as e:
         logger.error(f"Error handling interaction: {e}", exc_info=True)
-        return JSONResponse(content={"status": "ok"})
+        return ORJSONResponse(content={"status": "ok"})
 
 
 @app.get("/health")
@@ -773,16 +781,16 @@ async def github_webhook(request: Request):
         from app.triggers.webhooks import handle_github_webhook
         
         payload = await request.json()
-        success = await handle_github_webhook(payload)
+        success = await handle_github_webhook(payload, request.headers.get("X-GitHub-Event"))
         
         if success:
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         else:
-            return JSONResponse(content={"status": "ignored"}, status_code=200)
+            return ORJSONResponse(content={"status": "ignored"}, status_code=200)
             
     except Exception as e:
         logger.error(f"GitHub webhook error: {e}", exc_info=True)
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ORJSONResponse(content={"error": str(e)}, status_code=500)
 
 
 @app.post("/webhooks/jira")
@@ -795,13 +803,13 @@ async def jira_webhook(request: Request):
         success = await handle_jira_webhook(payload)
         
         if success:
-            return JSONResponse(content={"status": "ok"})
+            return ORJSONResponse(content={"status": "ok"})
         else:
-            return JSONResponse(content={"status": "ignored"}, status_code=200)
+            return ORJSONResponse(content={"status": "ignored"}, status_code=200)
             
     except Exception as e:
         logger.error(f"Jira webhook error: {e}", exc_info=True)
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ORJSONResponse(content={"error": str(e)}, status_code=500)
 
 
 if __name__ == "__main__":
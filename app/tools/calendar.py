@@ -5,6 +5,7 @@ Fetches user availability and events to determine free time slots.
 """
 
 import os
+import orjson
 from datetime import datetime, timedelta
 from typing import Optional
 from pathlib import Path
@@ -22,6 +23,14 @@ except ImportError as e:
     pass
 
 
+# Project root, for resolving relative credential file paths
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# (kind, path) of the credential file found by the first successful lookup.
+# Later lookups reuse it instead of probing every candidate file again.
+_credential_source: tuple[str, str] | None = None
+
+
 class CalendarEvent(BaseModel):
     """Represents a calendar event."""
     id: str
@@ -51,32 +60,16 @@ class CalendarAvailability(BaseModel):
     free_hours: float
 
 
-def _get_credentials(scope: str = 'readonly'):
+def _resolve_credential_source() -> tuple[str, str] | None:
     """
-    Get Google Calendar credentials.
+    Find the credential file to use.
     
-    Args:
-        scope: 'readonly' or 'write' - determines the scope of permissions
+    Checks, in order: token file containing a service account, explicit
+    GOOGLE_SERVICE_ACCOUNT_FILE, then token file as an OAuth token.
     
-    For development, use service account or OAuth.
-    For production, use service account key file.
+    Returns:
+        ("service_account" | "oauth", path), or None if no file is found
     """
-    try:
-        from google.oauth2.credentials import Credentials
-        from google.auth.transport.requests import Request
-        from google.oauth2 import service_account
-    except ImportError:
-        raise HTTPException(
-            status_code=500,
-            detail="Google Calendar API libraries not installed. Run: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
-        )
-    
-    # Determine scope
-    if scope == 'write':
-        SCOPES = ['https://www.googleapis.com/auth/calendar']
-    else:
-        SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
-    
     # Try service account first (production)
     service_account_file = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
     # Also check if token.json is a service account
@@ -86,49 +79,74 @@ def _get_credentials(scope: str = 'readonly'):
         token_file = token_file_env
     else:
         # Try project root first, then current directory
-        project_root = Path(__file__).resolve().parent.parent.parent
-        token_file = str(project_root / token_file_env)
+        token_file = str(_PROJECT_ROOT / token_file_env)
         if not os.path.exists(token_file):
             token_file = token_file_env  # Fallback to relative
     
     # Check if token.json is a service account
     if os.path.exists(token_file):
         try:
-            import json
-            with open(token_file, 'r') as f:
-                token_data = json.load(f)
+            with open(token_file, 'rb') as f:
+                token_data = orjson.loads(f.read())
                 if token_data.get('type') == 'service_account':
-                    # It's a service account
-                    credentials = service_account.Credentials.from_service_account_file(
-                        token_file, scopes=SCOPES
-                    )
-                    return credentials
+                    return ("service_account", token_file)
         except:
             pass
     
     # Use explicit service account file if provided (resolve path)
     if service_account_file:
         if not os.path.isabs(service_account_file):
-            project_root = Path(__file__).resolve().parent.parent.parent
-            service_account_file = str(project_root / service_account_file)
+            service_account_file = str(_PROJECT_ROOT / service_account_file)
         if os.path.exists(service_account_file):
-            credentials = service_account.Credentials.from_service_account_file(
-                service_account_file, scopes=SCOPES
-            )
-            return credentials
+            return ("service_account", service_account_file)
     
     # Try OAuth token file (development)
-    creds = None
+    if os.path.exists(token_file):
+        return ("oauth", token_file)
     
-    # Resolve token file path
-    if not os.path.isabs(token_file):
-        project_root = Path(__file__).resolve().parent.parent.parent
-        token_file_abs = project_root / token_file
-        if token_file_abs.exists():
-            token_file = str(token_file_abs)
+    return None
+
+
+def _get_credentials(scope: str = 'readonly'):
+    """
+    Get Google Calendar credentials.
     
-    if os.path.exists(token_file):
-        creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+    Args:
+        scope: 'readonly' or 'write' - determines the scope of permissions
+    
+    For development, use service account or OAuth.
+    For production, use service account key file.
+    """
+    try:
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+        from google.oauth2 import service_account
+    except ImportError:
+        raise HTTPException(
+            status_code=500,
+            detail="Google Calendar API libraries not installed. Run: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
+        )
+    
+    # Determine scope
+    if scope == 'write':
+        SCOPES = ['https://www.googleapis.com/auth/calendar']
+    else:
+        SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
+    
+    global _credential_source
+    if _credential_source is None:
+        _credential_source = _resolve_credential_source()
+    
+    creds = None
+    if _credential_source is not None:
+        kind, path = _credential_source
+        try:
+            if kind == "service_account":
+                return service_account.Credentials.from_service_account_file(path, scopes=SCOPES)
+            creds = Credentials.from_authorized_user_file(path, SCOPES)
+        except OSError:
+            # File moved or deleted since it was found - look again next time
+            _credential_source = None
     
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -213,6 +231,10 @@ def _is_service_account() -> bool:
     Check if we're using a service account (not OAuth).
     Service accounts need to use email addresses as calendar IDs for shared calendars.
     """
+    # Reuse the credential source found by _get_credentials if there is one
+    if _credential_source is not None:
+        return _credential_source[0] == "service_account"
+    
     service_account_file = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
     token_file = os.getenv("GOOGLE_TOKEN_FILE", "token.json")
     
@@ -223,8 +245,7 @@ def _is_service_account() -> bool:
     # Resolve token file path
     token_file_env = os.getenv("GOOGLE_TOKEN_FILE", "token.json")
     if not os.path.isabs(token_file_env):
-        project_root = Path(__file__).resolve().parent.parent.parent
-        token_file = str(project_root / token_file_env)
+        token_file = str(_PROJECT_ROOT / token_file_env)
         if not os.path.exists(token_file):
             token_file = token_file_env  # Fallback to relative
     else:
@@ -233,9 +254,8 @@ def _is_service_account() -> bool:
     # Check if token.json is a service account
     if os.path.exists(token_file):
         try:
-            import json
-            with open(token_file, 'r') as f:
-                token_data = json.load(f)
+            with open(token_file, 'rb') as f:
+                token_data = orjson.loads(f.read())
                 return token_data.get('type') == 'service_account'
         except:
             pass
@@ -2,6 +2,8 @@ import httpx
 import os
 from pydantic import BaseModel
 from fastapi import HTTPException
+from app.http_clients import get_github_client
+from app.tools.github_graphql import fetch_pr_context, fetch_pr_file_authors
 
 
 class GitHubPR(BaseModel):
@@ -107,6 +109,20 @@ def _calculate_pr_size(additions: int, deletions: int, changed_files: int) -> st
         return "large"
 
 
+def _overall_conclusion(check_runs: list[dict]) -> str | None:
+    """Determine overall CI conclusion from check runs."""
+    if not check_runs:
+        return None
+    elif all(c.get("conclusion") == "success" for c in check_runs):
+        return "success"
+    elif any(c.get("conclusion") == "failure" for c in check_runs):
+        return "failure"
+    elif any(c.get("status") == "in_progress" for c in check_runs):
+        return "pending"
+    else:
+        return "unknown"
+
+
 async def get_repo(owner: str | None = None, repo: str | None = None) -> GitHubRepo:
     """Get repository information."""
     if not owner or not repo:
@@ -114,32 +130,32 @@ async def get_repo(owner: str | None = None, repo: str | None = None) -> GitHubR
     
     headers = _get_github_headers()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}",
-                headers=headers
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"Repository {owner}/{repo} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        data = response.json()
-        return GitHubRepo(
-            name=data["name"],
-            full_name=data["full_name"],
-            description=data.get("description"),
-            html_url=data["html_url"],
-            default_branch=data["default_branch"],
-            open_issues_count=data["open_issues_count"]
+    client = get_github_client()
+    try:
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}",
+            headers=headers
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"Repository {owner}/{repo} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
         )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    data = response.json()
+    return GitHubRepo(
+        name=data["name"],
+        full_name=data["full_name"],
+        description=data.get("description"),
+        html_url=data["html_url"],
+        default_branch=data["default_branch"],
+        open_issues_count=data["open_issues_count"]
+    )
 
 
 async def get_pull_requests(
@@ -153,36 +169,36 @@ async def get_pull_requests(
     
     headers = _get_github_headers()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls",
-                headers=headers,
-                params={"state": state, "per_page": 30}
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        prs = response.json()
-        return [
-            GitHubPR(
-                number=pr["number"],
-                title=pr["title"],
-                state=pr["state"],
-                draft=pr.get("draft", False),
-                user=pr["user"]["login"],
-                created_at=pr["created_at"],
-                updated_at=pr["updated_at"],
-                html_url=pr["html_url"]
-            )
-            for pr in prs
-        ]
+    client = get_github_client()
+    try:
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls",
+            headers=headers,
+            params={"state": state, "per_page": 30}
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    prs = response.json()
+    return [
+        GitHubPR(
+            number=pr["number"],
+            title=pr["title"],
+            state=pr["state"],
+            draft=pr.get("draft", False),
+            user=pr["user"]["login"],
+            created_at=pr["created_at"],
+            updated_at=pr["updated_at"],
+            html_url=pr["html_url"]
+        )
+        for pr in prs
+    ]
 
 
 async def get_pull_request(
@@ -196,48 +212,48 @@ async def get_pull_request(
     
     headers = _get_github_headers()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers=headers
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        pr = response.json()
-        
-        additions = pr.get("additions", 0)
-        deletions = pr.get("deletions", 0)
-        changed_files = pr.get("changed_files", 0)
-        
-        return GitHubPRDetail(
-            number=pr["number"],
-            title=pr["title"],
-            state=pr["state"],
-            draft=pr.get("draft", False),
-            user=pr["user"]["login"],
-            created_at=pr["created_at"],
-            updated_at=pr["updated_at"],
-            html_url=pr["html_url"],
-            additions=additions,
-            deletions=deletions,
-            changed_files=changed_files,
-            pr_size=_calculate_pr_size(additions, deletions, changed_files),
-            mergeable=pr.get("mergeable"),
-            merged=pr.get("merged", False),
-            head_branch=pr["head"]["ref"],
-            base_branch=pr["base"]["ref"],
-            body=pr.get("body")
+    client = get_github_client()
+    try:
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
+            headers=headers
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
         )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    pr = response.json()
+    
+    additions = pr.get("additions", 0)
+    deletions = pr.get("deletions", 0)
+    changed_files = pr.get("changed_files", 0)
+    
+    return GitHubPRDetail(
+        number=pr["number"],
+        title=pr["title"],
+        state=pr["state"],
+        draft=pr.get("draft", False),
+        user=pr["user"]["login"],
+        created_at=pr["created_at"],
+        updated_at=pr["updated_at"],
+        html_url=pr["html_url"],
+        additions=additions,
+        deletions=deletions,
+        changed_files=changed_files,
+        pr_size=_calculate_pr_size(additions, deletions, changed_files),
+        mergeable=pr.get("mergeable"),
+        merged=pr.get("merged", False),
+        head_branch=pr["head"]["ref"],
+        base_branch=pr["base"]["ref"],
+        body=pr.get("body")
+    )
 
 
 async def get_pr_checks(
@@ -251,66 +267,54 @@ async def get_pr_checks(
     
     headers = _get_github_headers()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # First get the PR to find the head SHA
-        try:
-            pr_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers=headers
-            )
-            pr_response.raise_for_status()
-            pr_data = pr_response.json()
-            head_sha = pr_data["head"]["sha"]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        
-        # Get check runs for the commit
-        try:
-            checks_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
-                headers=headers
-            )
-            checks_response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        data = checks_response.json()
-        check_runs = data.get("check_runs", [])
-        
-        # Determine overall conclusion
-        if not check_runs:
-            overall = None
-        elif all(c.get("conclusion") == "success" for c in check_runs):
-            overall = "success"
-        elif any(c.get("conclusion") == "failure" for c in check_runs):
-            overall = "failure"
-        elif any(c.get("status") == "in_progress" for c in check_runs):
-            overall = "pending"
-        else:
-            overall = "unknown"
-        
-        return GitHubCheckStatus(
-            total_count=data.get("total_count", 0),
-            conclusion=overall,
-            checks=[
-                {
-                    "name": c["name"],
-                    "status": c["status"],
-                    "conclusion": c.get("conclusion")
-                }
-                for c in check_runs
-            ]
+    client = get_github_client()
+    # First get the PR to find the head SHA
+    try:
+        pr_response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
+            headers=headers
+        )
+        pr_response.raise_for_status()
+        pr_data = pr_response.json()
+        head_sha = pr_data["head"]["sha"]
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    
+    # Get check runs for the commit
+    try:
+        checks_response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
+            headers=headers
+        )
+        checks_response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
         )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    data = checks_response.json()
+    check_runs = data.get("check_runs", [])
+    
+    return GitHubCheckStatus(
+        total_count=data.get("total_count", 0),
+        conclusion=_overall_conclusion(check_runs),
+        checks=[
+            {
+                "name": c["name"],
+                "status": c["status"],
+                "conclusion": c.get("conclusion")
+            }
+            for c in check_runs
+        ]
+    )
 
 
 async def get_pr_reviews(
@@ -324,32 +328,32 @@ async def get_pr_reviews(
     
     headers = _get_github_headers()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-                headers=headers
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        reviews = response.json()
-        return [
-            GitHubReview(
-                user=review["user"]["login"],
-                state=review["state"],
-                submitted_at=review.get("submitted_at")
-            )
-            for review in reviews
-        ]
+    client = get_github_client()
+    try:
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
+            headers=headers
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    reviews = response.json()
+    return [
+        GitHubReview(
+            user=review["user"]["login"],
+            state=review["state"],
+            submitted_at=review.get("submitted_at")
+        )
+        for review in reviews
+    ]
 
 
 async def get_recent_commits(
@@ -367,33 +371,33 @@ async def get_recent_commits(
     if author:
         params["author"] = author
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/commits",
-                headers=headers,
-                params=params
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
-        
-        commits = response.json()
-        return [
-            GitHubCommit(
-                sha=commit["sha"][:7],
-                message=commit["commit"]["message"].split("\n")[0],  # First line only
-                author=commit["commit"]["author"]["name"],
-                date=commit["commit"]["author"]["date"],
-                html_url=commit["html_url"]
-            )
-            for commit in commits
-        ]
+    client = get_github_client()
+    try:
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/commits",
+            headers=headers,
+            params=params
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+    
+    commits = response.json()
+    return [
+        GitHubCommit(
+            sha=commit["sha"][:7],
+            message=commit["commit"]["message"].split("\n")[0],  # First line only
+            author=commit["commit"]["author"]["name"],
+            date=commit["commit"]["author"]["date"],
+            html_url=commit["html_url"]
+        )
+        for commit in commits
+    ]
 
 
 async def get_pr_context(
@@ -408,10 +412,61 @@ async def get_pr_context(
     if not owner or not repo:
         owner, repo = _get_default_repo()
     
-    # Fetch all data in parallel
-    pr_detail = await get_pull_request(pr_number, owner, repo)
-    checks = await get_pr_checks(pr_number, owner, repo)
-    reviews = await get_pr_reviews(pr_number, owner, repo)
+    # Fetch PR details, checks, and reviews in a single GraphQL request
+    pr = await fetch_pr_context(owner, repo, pr_number, _get_github_headers())
+    
+    additions = pr.get("additions", 0)
+    deletions = pr.get("deletions", 0)
+    changed_files = pr.get("changedFiles", 0)
+    mergeable = {"MERGEABLE": True, "CONFLICTING": False}.get(pr.get("mergeable"))
+    
+    pr_detail = GitHubPRDetail(
+        number=pr["number"],
+        title=pr["title"],
+        # REST reports merged PRs as closed
+        state="open" if pr["state"] == "OPEN" else "closed",
+        draft=pr.get("isDraft", False),
+        user=(pr.get("author") or {}).get("login", "ghost"),
+        created_at=pr["createdAt"],
+        updated_at=pr["updatedAt"],
+        html_url=pr["url"],
+        additions=additions,
+        deletions=deletions,
+        changed_files=changed_files,
+        pr_size=_calculate_pr_size(additions, deletions, changed_files),
+        mergeable=mergeable,
+        merged=pr.get("merged", False),
+        head_branch=pr["headRefName"],
+        base_branch=pr["baseRefName"],
+        body=pr.get("body")
+    )
+    
+    # Check runs on the head commit, lowercased to match the REST check-runs API
+    commit_nodes = (pr.get("commits") or {}).get("nodes") or []
+    rollup = commit_nodes[0]["commit"].get("statusCheckRollup") if commit_nodes else None
+    check_runs = [
+        {
+            "name": node["name"],
+            "status": node["status"].lower(),
+            "conclusion": node["conclusion"].lower() if node.get("conclusion") else None
+        }
+        for node in ((rollup or {}).get("contexts") or {}).get("nodes") or []
+        if node.get("name")  # Commit statuses come back as empty nodes
+    ]
+    checks = GitHubCheckStatus(
+        total_count=len(check_runs),
+        conclusion=_overall_conclusion(check_runs),
+        checks=check_runs
+    )
+    
+    reviews = [
+        GitHubReview(
+            user=(review.get("author") or {}).get("login", "ghost"),
+            state=review["state"],
+            submitted_at=review.get("submittedAt")
+        )
+        for review in (pr.get("reviews") or {}).get("nodes") or []
+    ]
     
     # Count approvals
     approvals = sum(1 for r in reviews if r.state == "APPROVED")
@@ -435,6 +490,22 @@ async def get_pr_context(
     }
 
 
+async def get_pr_file_authors(
+    pr_number: int,
+    owner: str | None = None,
+    repo: str | None = None
+) -> dict[str, set[str]]:
+    """
+    Get the files changed in a PR and who authored their existing lines.
+    
+    Returns a dict of path -> lowercased GitHub logins from blame on the base branch.
+    """
+    if not owner or not repo:
+        owner, repo = _get_default_repo()
+    
+    return await fetch_pr_file_authors(owner, repo, pr_number, _get_github_headers())
+
+
 async def create_pull_request(
     title: str,
     body: str | None = None,
@@ -477,30 +548,30 @@ async def create_pull_request(
     if body:
         payload["body"] = body
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to GitHub: {str(e)}"
-            )
-        
-        pr_data = response.json()
-        pr_number = pr_data["number"]
-        
-        # Fetch full PR details
-        return await get_pull_request(pr_number, owner, repo)
+    client = get_github_client()
+    try:
+        response = await client.post(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls",
+            headers=headers,
+            json=payload
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to GitHub: {str(e)}"
+        )
+    
+    pr_data = response.json()
+    pr_number = pr_data["number"]
+    
+    # Fetch full PR details
+    return await get_pull_request(pr_number, owner, repo)
 
 
 async def update_pull_request(
@@ -560,29 +631,29 @@ async def update_pull_request(
             detail="At least one field (title, body/description, state, base) must be provided"
         )
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.patch(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to GitHub: {str(e)}"
-            )
-        
-        # Fetch updated PR details
-        return await get_pull_request(pr_number, owner, repo)
+    client = get_github_client()
+    try:
+        response = await client.patch(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
+            headers=headers,
+            json=payload
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to GitHub: {str(e)}"
+        )
+    
+    # Fetch updated PR details
+    return await get_pull_request(pr_number, owner, repo)
 
 
 async def update_pr_assignees(
@@ -613,20 +684,20 @@ async def update_pr_assignees(
     current_pr = await get_pull_request(pr_number, owner, repo)
     
     # Get current assignees from the issue (PRs use issue endpoints for assignees)
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            issue_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
-                headers=headers
-            )
-            issue_response.raise_for_status()
-            issue_data = issue_response.json()
-            current_assignees = [assignee["login"] for assignee in issue_data.get("assignees", [])]
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
+    client = get_github_client()
+    try:
+        issue_response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
+            headers=headers
+        )
+        issue_response.raise_for_status()
+        issue_data = issue_response.json()
+        current_assignees = [assignee["login"] for assignee in issue_data.get("assignees", [])]
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
     
     # Build new assignees list
     new_assignees = set(current_assignees)
@@ -642,34 +713,34 @@ async def update_pr_assignees(
         "assignees": list(new_assignees)
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.patch(
-                f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to GitHub: {str(e)}"
-            )
-        
-        updated_issue = response.json()
-        return {
-            "pr_number": pr_number,
-            "assignees": [assignee["login"] for assignee in updated_issue.get("assignees", [])],
-            "added": assignees or [],
-            "removed": remove_assignees or []
-        }
+    client = get_github_client()
+    try:
+        response = await client.patch(
+            f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
+            headers=headers,
+            json=payload
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to GitHub: {str(e)}"
+        )
+    
+    updated_issue = response.json()
+    return {
+        "pr_number": pr_number,
+        "assignees": [assignee["login"] for assignee in updated_issue.get("assignees", [])],
+        "added": assignees or [],
+        "removed": remove_assignees or []
+    }
 
 
 async def update_pr_labels(
@@ -697,20 +768,20 @@ async def update_pr_labels(
         owner, repo = _get_default_repo()
     
     # Get current labels
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            issue_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
-                headers=headers
-            )
-            issue_response.raise_for_status()
-            issue_data = issue_response.json()
-            current_labels = [label["name"] for label in issue_data.get("labels", [])]
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
+    client = get_github_client()
+    try:
+        issue_response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
+            headers=headers
+        )
+        issue_response.raise_for_status()
+        issue_data = issue_response.json()
+        current_labels = [label["name"] for label in issue_data.get("labels", [])]
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
     
     # Build new labels list
     new_labels = set(current_labels)
@@ -726,34 +797,34 @@ async def update_pr_labels(
         "labels": list(new_labels)
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.patch(
-                f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to GitHub: {str(e)}"
-            )
-        
-        updated_issue = response.json()
-        return {
-            "pr_number": pr_number,
-            "labels": [label["name"] for label in updated_issue.get("labels", [])],
-            "added": labels or [],
-            "removed": remove_labels or []
-        }
+    client = get_github_client()
+    try:
+        response = await client.patch(
+            f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}",
+            headers=headers,
+            json=payload
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to GitHub: {str(e)}"
+        )
+    
+    updated_issue = response.json()
+    return {
+        "pr_number": pr_number,
+        "labels": [label["name"] for label in updated_issue.get("labels", [])],
+        "added": labels or [],
+        "removed": remove_labels or []
+    }
 
 
 async def request_pr_review(
@@ -792,31 +863,31 @@ async def request_pr_review(
     if team_reviewers:
         payload["team_reviewers"] = team_reviewers
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/requested_reviewers",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"GitHub API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to GitHub: {str(e)}"
-            )
-        
-        result = response.json()
-        return {
-            "pr_number": pr_number,
-            "requested_reviewers": [r["login"] for r in result.get("requested_reviewers", [])],
-            "requested_teams": [t["slug"] for t in result.get("requested_teams", [])]
-        }
+    client = get_github_client()
+    try:
+        response = await client.post(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/requested_reviewers",
+            headers=headers,
+            json=payload
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to GitHub: {str(e)}"
+        )
+    
+    result = response.json()
+    return {
+        "pr_number": pr_number,
+        "requested_reviewers": [r["login"] for r in result.get("requested_reviewers", [])],
+        "requested_teams": [t["slug"] for t in result.get("requested_teams", [])]
+    }
 
@@ -0,0 +1,186 @@
+"""
+GitHub GraphQL queries for continuum.ai
+
+Fetches a PR's details, head-commit check runs, and reviews in one request,
+and blames the files a PR changes (one request for the file list, one aliased
+blame request for all of them) to find who owns the code it touches.
+"""
+
+import httpx
+from fastapi import HTTPException
+from app.http_clients import get_github_client
+
+
+# PR details, head-commit check runs, and reviews in one request
+PR_CONTEXT_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number
+      title
+      state
+      isDraft
+      author { login }
+      createdAt
+      updatedAt
+      url
+      additions
+      deletions
+      changedFiles
+      mergeable
+      merged
+      headRefName
+      baseRefName
+      body
+      commits(last: 1) {
+        nodes {
+          commit {
+            statusCheckRollup {
+              contexts(first: 100) {
+                nodes {
+                  ... on CheckRun { name status conclusion }
+                }
+              }
+            }
+          }
+        }
+      }
+      reviews(first: 100) {
+        nodes {
+          author { login }
+          state
+          submittedAt
+        }
+      }
+    }
+  }
+}
+"""
+
+
+async def graphql(query: str, variables: dict, headers: dict, allow_partial: bool = False) -> dict:
+    """
+    Run a GitHub GraphQL query and return its data.
+    
+    With allow_partial, field-level errors are ignored as long as data came back.
+    """
+    client = get_github_client()
+    try:
+        response = await client.post(
+            "https://api.github.com/graphql",
+            headers=headers,
+            json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"GitHub API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Failed to connect to GitHub: {str(e)}")
+
+    payload = response.json()
+    if payload.get("errors") and not (allow_partial and payload.get("data")):
+        if any(err.get("type") == "NOT_FOUND" for err in payload["errors"]):
+            raise HTTPException(status_code=404, detail=payload["errors"][0].get("message", "Not found"))
+        raise HTTPException(
+            status_code=502,
+            detail=f"GitHub GraphQL error: {'; '.join(err.get('message', '') for err in payload['errors'])}"
+        )
+    return payload["data"]
+
+
+async def fetch_pr_context(owner: str, repo: str, pr_number: int, headers: dict) -> dict:
+    """Fetch the raw pullRequest node for PR_CONTEXT_QUERY."""
+    data = await graphql(
+        PR_CONTEXT_QUERY,
+        {"owner": owner, "repo": repo, "number": pr_number},
+        headers
+    )
+    pr = (data.get("repository") or {}).get("pullRequest")
+    if pr is None:
+        raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+    return pr
+
+
+# Changed file paths and the base branch to blame them against
+PR_FILES_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      baseRefName
+      files(first: 100) {
+        nodes { path }
+      }
+    }
+  }
+}
+"""
+
+
+def _blame_query(path_count: int) -> str:
+    """Build a query that blames path_count files (variables $p0..$pN) at $ref."""
+    path_vars = "".join(f", $p{i}: String!" for i in range(path_count))
+    blames = "\n".join(
+        f"        f{i}: blame(path: $p{i}) {{ ranges {{ commit {{ author {{ user {{ login }} }} }} }} }}"
+        for i in range(path_count)
+    )
+    return f"""
+query($owner: String!, $repo: String!, $ref: String!{path_vars}) {{
+  repository(owner: $owner, name: $repo) {{
+    object(expression: $ref) {{
+      ... on Commit {{
+{blames}
+      }}
+    }}
+  }}
+}}
+"""
+
+
+async def fetch_pr_file_authors(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    headers: dict,
+    max_files: int = 20
+) -> dict[str, set[str]]:
+    """
+    Map each file changed in a PR to the GitHub logins that authored its lines.
+    
+    Uses two requests however many files changed: one for the file list and
+    one that blames up to max_files of them on the base branch.
+    
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        pr_number: Pull request number
+        headers: GitHub API headers
+        max_files: Most files to blame (the rest map to no authors)
+    
+    Returns:
+        Dict of path -> lowercased author logins
+    """
+    data = await graphql(PR_FILES_QUERY, {"owner": owner, "repo": repo, "number": pr_number}, headers)
+    pr = (data.get("repository") or {}).get("pullRequest")
+    if pr is None:
+        raise HTTPException(status_code=404, detail=f"PR #{pr_number} not found")
+    
+    paths = [node["path"] for node in (pr.get("files") or {}).get("nodes") or []]
+    authors: dict[str, set[str]] = {path: set() for path in paths}
+    blamed = paths[:max_files]
+    if not blamed:
+        return authors
+    
+    variables = {"owner": owner, "repo": repo, "ref": pr["baseRefName"]}
+    variables.update({f"p{i}": path for i, path in enumerate(blamed)})
+    # A file added by the PR can't be blamed on the base branch; keep the rest
+    data = await graphql(_blame_query(len(blamed)), variables, headers, allow_partial=True)
+    commit = (data.get("repository") or {}).get("object") or {}
+    for i, path in enumerate(blamed):
+        for blame_range in (commit.get(f"f{i}") or {}).get("ranges") or []:
+            user = ((blame_range.get("commit") or {}).get("author") or {}).get("user")
+            if user and user.get("login"):
+                authors[path].add(user["login"].lower())
+    return authors
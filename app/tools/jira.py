@@ -1,7 +1,19 @@
+import asyncio
+import logging
 import httpx
 import os
+from typing import Awaitable, Callable
 from pydantic import BaseModel
 from fastapi import HTTPException
+from app.http_clients import get_jira_client
+
+logger = logging.getLogger(__name__)
+
+# Endpoints we've already warned about capping our page size
+_page_cap_warned: set[str] = set()
+
+# Most follow-up pages requested at once, to stay clear of Jira's rate limits
+_MAX_CONCURRENT_PAGES = 4
 
 
 class JiraIssue(BaseModel):
@@ -71,6 +83,56 @@ def _get_jira_base_url() -> str:
     return url.rstrip("/")
 
 
+async def _fetch_pages(
+    endpoint: str,
+    fetch_page: Callable[[int, int], Awaitable[dict]],
+    max_results: int,
+    batch_size: int
+) -> list[dict]:
+    """
+    Collect up to max_results raw issues from a paginated Jira endpoint.
+    
+    Asks for batch_size issues per page. Jira may cap the page size lower; the
+    first response tells us the real cap and the total, and the remaining pages
+    are then requested concurrently (at most _MAX_CONCURRENT_PAGES at a time).
+    A failed follow-up page is logged and skipped rather than discarding the
+    pages that did arrive.
+    
+    Args:
+        endpoint: Endpoint name for logging
+        fetch_page: Coroutine taking (start_at, page_size), returning the response JSON
+        max_results: Most issues to return
+        batch_size: Issues to request per page
+    """
+    requested = min(batch_size, max_results)
+    first = await fetch_page(0, requested)
+    issues = first.get("issues", [])
+    total = min(first.get("total", len(issues)), max_results)
+    page_size = first.get("maxResults") or len(issues)
+    
+    if page_size < requested and endpoint not in _page_cap_warned:
+        _page_cap_warned.add(endpoint)
+        logger.warning(f"Jira {endpoint} caps pages at {page_size} issues (asked for {requested})")
+    
+    if len(issues) >= total or page_size <= 0:
+        return issues[:max_results]
+    
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+    
+    async def bounded_fetch(start: int) -> dict:
+        async with semaphore:
+            return await fetch_page(start, min(page_size, total - start))
+    
+    starts = range(len(issues), total, page_size)
+    pages = await asyncio.gather(*[bounded_fetch(start) for start in starts], return_exceptions=True)
+    for start, page in zip(starts, pages):
+        if isinstance(page, BaseException):
+            logger.warning(f"Jira {endpoint} page at {start} failed, skipping it: {page}")
+            continue
+        issues.extend(page.get("issues", []))
+    return issues[:max_results]
+
+
 def _extract_description(description_field) -> str | None:
     """Extract plain text from Jira v3 ADF description format."""
     if description_field is None:
@@ -88,12 +150,25 @@ def _extract_description(description_field) -> str | None:
     return str(description_field)
 
 
-async def get_jira_issues(jql: str = "assignee=currentUser()") -> list[JiraIssue]:
-    """Fetch issues from Jira using JQL query (v3 API)."""
+async def get_jira_issues(
+    jql: str = "assignee=currentUser()",
+    max_results: int = 50,
+    batch_size: int = 500
+) -> list[JiraIssue]:
+    """
+    Fetch issues from Jira using JQL query (v3 API).
+    
+    Args:
+        jql: JQL query string
+        max_results: Most issues to return
+        batch_size: Issues requested per page (Jira may cap this lower)
+    """
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    client = get_jira_client()
+    
+    async def fetch_page(start_at: int, page_size: int) -> dict:
         try:
             # Use standard search endpoint which is more reliable
             response = await client.post(
@@ -101,7 +176,8 @@ async def get_jira_issues(jql: str = "assignee=currentUser()") -> list[JiraIssue
                 auth=auth,
                 json={
                     "jql": jql,
-                    "maxResults": 50,
+                    "startAt": start_at,
+                    "maxResults": page_size,
                     "fields": ["key", "summary", "status", "priority", "assignee", "description", "issuetype"]
                 }
             )
@@ -116,38 +192,36 @@ async def get_jira_issues(jql: str = "assignee=currentUser()") -> list[JiraIssue
                 status_code=503,
                 detail=f"Failed to connect to Jira: {str(e)}"
             )
-        
-        data = response.json()
-        # Standard search endpoint returns issues in "issues" array
-        issues = data.get("issues", [])
-        
-        result = []
-        for issue in issues:
-            try:
-                # Standard structure: issue has "key" and "fields"
-                issue_key = issue.get("key")
-                if not issue_key:
-                    continue
-                
-                fields = issue.get("fields", {})
-                
-                result.append(JiraIssue(
-                    key=issue_key,
-                    summary=fields.get("summary", "No summary"),
-                    status=fields.get("status", {}).get("name", "Unknown") if isinstance(fields.get("status"), dict) else str(fields.get("status", "Unknown")),
-                    priority=(fields.get("priority") or {}).get("name") if isinstance(fields.get("priority"), dict) else fields.get("priority"),
-                    assignee=(fields.get("assignee") or {}).get("displayName") if isinstance(fields.get("assignee"), dict) else fields.get("assignee"),
-                    description=_extract_description(fields.get("description")),
-                    issue_type=(fields.get("issuetype") or {}).get("name") if isinstance(fields.get("issuetype"), dict) else fields.get("issuetype")
-                ))
-            except Exception as e:
-                # Log and skip malformed issues
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Skipping malformed issue: {issue}, error: {e}")
+        return response.json()
+    
+    # Standard search endpoint returns issues in "issues" array
+    issues = await _fetch_pages("search", fetch_page, max_results, batch_size)
+    
+    result = []
+    for issue in issues:
+        try:
+            # Standard structure: issue has "key" and "fields"
+            issue_key = issue.get("key")
+            if not issue_key:
                 continue
-        
-        return result
+            
+            fields = issue.get("fields", {})
+            
+            result.append(JiraIssue(
+                key=issue_key,
+                summary=fields.get("summary", "No summary"),
+                status=fields.get("status", {}).get("name", "Unknown") if isinstance(fields.get("status"), dict) else str(fields.get("status", "Unknown")),
+                priority=(fields.get("priority") or {}).get("name") if isinstance(fields.get("priority"), dict) else fields.get("priority"),
+                assignee=(fields.get("assignee") or {}).get("displayName") if isinstance(fields.get("assignee"), dict) else fields.get("assignee"),
+                description=_extract_description(fields.get("description")),
+                issue_type=(fields.get("issuetype") or {}).get("name") if isinstance(fields.get("issuetype"), dict) else fields.get("issuetype")
+            ))
+        except Exception as e:
+            # Log and skip malformed issues
+            logger.warning(f"Skipping malformed issue: {issue}, error: {e}")
+            continue
+    
+    return result
 
 
 async def get_single_issue(issue_key: str) -> JiraIssueDetail:
@@ -155,46 +229,46 @@ async def get_single_issue(issue_key: str) -> JiraIssueDetail:
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/rest/api/3/issue/{issue_key}",
-                auth=auth
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Issue {issue_key} not found"
-                )
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
+    client = get_jira_client()
+    try:
+        response = await client.get(
+            f"{base_url}/rest/api/3/issue/{issue_key}",
+            auth=auth
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
             raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
+                status_code=404,
+                detail=f"Issue {issue_key} not found"
             )
-        
-        issue = response.json()
-        fields = issue["fields"]
-        
-        return JiraIssueDetail(
-            key=issue["key"],
-            summary=fields["summary"],
-            status=fields["status"]["name"],
-            priority=(fields.get("priority") or {}).get("name"),
-            assignee=(fields.get("assignee") or {}).get("displayName"),
-            description=_extract_description(fields.get("description")),
-            issue_type=(fields.get("issuetype") or {}).get("name"),
-            labels=fields.get("labels", []),
-            components=[c["name"] for c in fields.get("components", [])],
-            created=fields.get("created"),
-            updated=fields.get("updated"),
-            due_time=fields.get("customfield_10039")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
         )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    issue = response.json()
+    fields = issue["fields"]
+    
+    return JiraIssueDetail(
+        key=issue["key"],
+        summary=fields["summary"],
+        status=fields["status"]["name"],
+        priority=(fields.get("priority") or {}).get("name"),
+        assignee=(fields.get("assignee") or {}).get("displayName"),
+        description=_extract_description(fields.get("description")),
+        issue_type=(fields.get("issuetype") or {}).get("name"),
+        labels=fields.get("labels", []),
+        components=[c["name"] for c in fields.get("components", [])],
+        created=fields.get("created"),
+        updated=fields.get("updated"),
+        due_time=fields.get("customfield_10039")
+    )
 
 
 async def get_projects() -> list[JiraProject]:
@@ -202,34 +276,34 @@ async def get_projects() -> list[JiraProject]:
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/rest/api/3/project",
-                auth=auth
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
-            )
-        
-        projects = response.json()
-        return [
-            JiraProject(
-                id=project["id"],
-                key=project["key"],
-                name=project["name"],
-                project_type=project.get("projectTypeKey")
-            )
-            for project in projects
-        ]
+    client = get_jira_client()
+    try:
+        response = await client.get(
+            f"{base_url}/rest/api/3/project",
+            auth=auth
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    projects = response.json()
+    return [
+        JiraProject(
+            id=project["id"],
+            key=project["key"],
+            name=project["name"],
+            project_type=project.get("projectTypeKey")
+        )
+        for project in projects
+    ]
 
 
 async def get_boards() -> list[JiraBoard]:
@@ -237,35 +311,35 @@ async def get_boards() -> list[JiraBoard]:
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/rest/agile/1.0/board",
-                auth=auth
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
-            )
-        
-        data = response.json()
-        boards = data.get("values", [])
-        return [
-            JiraBoard(
-                id=board["id"],
-                name=board["name"],
-                board_type=board.get("type", "unknown"),
-                project_key=board.get("location", {}).get("projectKey")
-            )
-            for board in boards
-        ]
+    client = get_jira_client()
+    try:
+        response = await client.get(
+            f"{base_url}/rest/agile/1.0/board",
+            auth=auth
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    data = response.json()
+    boards = data.get("values", [])
+    return [
+        JiraBoard(
+            id=board["id"],
+            name=board["name"],
+            board_type=board.get("type", "unknown"),
+            project_key=board.get("location", {}).get("projectKey")
+        )
+        for board in boards
+    ]
 
 
 async def get_fields(search: str | None = None) -> list[JiraField]:
@@ -273,54 +347,67 @@ async def get_fields(search: str | None = None) -> list[JiraField]:
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{base_url}/rest/api/3/field",
-                auth=auth
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
-            )
-        
-        fields = response.json()
-        result = [
-            JiraField(
-                id=field["id"],
-                name=field["name"],
-                field_type=field.get("schema", {}).get("type"),
-                is_custom=field.get("custom", False)
-            )
-            for field in fields
-        ]
-        
-        # Filter by search term if provided
-        if search:
-            search_lower = search.lower()
-            result = [f for f in result if search_lower in f.name.lower()]
-        
-        return result
+    client = get_jira_client()
+    try:
+        response = await client.get(
+            f"{base_url}/rest/api/3/field",
+            auth=auth
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    fields = response.json()
+    result = [
+        JiraField(
+            id=field["id"],
+            name=field["name"],
+            field_type=field.get("schema", {}).get("type"),
+            is_custom=field.get("custom", False)
+        )
+        for field in fields
+    ]
+    
+    # Filter by search term if provided
+    if search:
+        search_lower = search.lower()
+        result = [f for f in result if search_lower in f.name.lower()]
+    
+    return result
 
 
-async def get_board_issues(board_id: int) -> list[JiraIssueDetail]:
-    """Fetch all issues from a specific Jira board with full details."""
+async def get_board_issues(
+    board_id: int,
+    max_results: int = 50,
+    batch_size: int = 500
+) -> list[JiraIssueDetail]:
+    """
+    Fetch issues from a specific Jira board with full details.
+    
+    Args:
+        board_id: The Jira board ID
+        max_results: Most issues to return
+        batch_size: Issues requested per page (Jira may cap this lower)
+    """
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    client = get_jira_client()
+    
+    async def fetch_page(start_at: int, page_size: int) -> dict:
         try:
             response = await client.get(
                 f"{base_url}/rest/agile/1.0/board/{board_id}/issue",
                 auth=auth,
-                params={"maxResults": 50}
+                params={"startAt": start_at, "maxResults": page_size}
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -338,27 +425,27 @@ async def get_board_issues(board_id: int) -> list[JiraIssueDetail]:
                 status_code=503,
                 detail=f"Failed to connect to Jira: {str(e)}"
             )
-        
-        data = response.json()
-        issues = data.get("issues", [])
-        
-        return [
-            JiraIssueDetail(
-                key=issue["key"],
-                summary=issue["fields"]["summary"],
-                status=issue["fields"]["status"]["name"],
-                priority=(issue["fields"].get("priority") or {}).get("name"),
-                assignee=(issue["fields"].get("assignee") or {}).get("displayName"),
-                description=_extract_description(issue["fields"].get("description")),
-                issue_type=(issue["fields"].get("issuetype") or {}).get("name"),
-                labels=issue["fields"].get("labels", []),
-                components=[c["name"] for c in issue["fields"].get("components", [])],
-                created=issue["fields"].get("created"),
-                updated=issue["fields"].get("updated"),
-                due_time=issue["fields"].get("customfield_10039")
-            )
-            for issue in issues
-        ]
+        return response.json()
+    
+    issues = await _fetch_pages("board issues", fetch_page, max_results, batch_size)
+    
+    return [
+        JiraIssueDetail(
+            key=issue["key"],
+            summary=issue["fields"]["summary"],
+            status=issue["fields"]["status"]["name"],
+            priority=(issue["fields"].get("priority") or {}).get("name"),
+            assignee=(issue["fields"].get("assignee") or {}).get("displayName"),
+            description=_extract_description(issue["fields"].get("description")),
+            issue_type=(issue["fields"].get("issuetype") or {}).get("name"),
+            labels=issue["fields"].get("labels", []),
+            components=[c["name"] for c in issue["fields"].get("components", [])],
+            created=issue["fields"].get("created"),
+            updated=issue["fields"].get("updated"),
+            due_time=issue["fields"].get("customfield_10039")
+        )
+        for issue in issues
+    ]
 
 
 async def find_user_by_name(name: str) -> dict | None:
@@ -374,43 +461,43 @@ async def find_user_by_name(name: str) -> dict | None:
     auth = _get_jira_auth()
     base_url = _get_jira_base_url()
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            # Search for users
-            response = await client.get(
-                f"{base_url}/rest/api/3/user/search",
-                auth=auth,
-                params={"query": name, "maxResults": 10}
-            )
-            response.raise_for_status()
-            users = response.json()
-            
-            # Try to find exact match by display name or email
-            name_lower = name.lower()
-            for user in users:
-                display_name = (user.get("displayName") or "").lower()
-                email = (user.get("emailAddress") or "").lower()
-                if name_lower in display_name or name_lower in email:
-                    return {
-                        "accountId": user.get("accountId"),
-                        "displayName": user.get("displayName"),
-                        "emailAddress": user.get("emailAddress")
-                    }
-            
-            # Return first result if no exact match
-            if users:
+    client = get_jira_client()
+    try:
+        # Search for users
+        response = await client.get(
+            f"{base_url}/rest/api/3/user/search",
+            auth=auth,
+            params={"query": name, "maxResults": 10}
+        )
+        response.raise_for_status()
+        users = response.json()
+        
+        # Try to find exact match by display name or email
+        name_lower = name.lower()
+        for user in users:
+            display_name = (user.get("displayName") or "").lower()
+            email = (user.get("emailAddress") or "").lower()
+            if name_lower in display_name or name_lower in email:
                 return {
-                    "accountId": users[0].get("accountId"),
-                    "displayName": users[0].get("displayName"),
-                    "emailAddress": users[0].get("emailAddress")
+                    "accountId": user.get("accountId"),
+                    "displayName": user.get("displayName"),
+                    "emailAddress": user.get("emailAddress")
                 }
-            
-            return None
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
+        
+        # Return first result if no exact match
+        if users:
+            return {
+                "accountId": users[0].get("accountId"),
+                "displayName": users[0].get("displayName"),
+                "emailAddress": users[0].get("emailAddress")
+            }
+        
+        return None
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
 
 
 async def create_issue(
@@ -491,30 +578,30 @@ async def create_issue(
     if labels:
         fields["labels"] = labels
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                f"{base_url}/rest/api/3/issue",
-                auth=auth,
-                json={"fields": fields}
-            )
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
-            )
-        
-        created_issue = response.json()
-        issue_key = created_issue["key"]
-        
-        # Fetch full issue details
-        return await get_single_issue(issue_key)
+    client = get_jira_client()
+    try:
+        response = await client.post(
+            f"{base_url}/rest/api/3/issue",
+            auth=auth,
+            json={"fields": fields}
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    created_issue = response.json()
+    issue_key = created_issue["key"]
+    
+    # Fetch full issue details
+    return await get_single_issue(issue_key)
 
 
 async def update_issue(
@@ -593,56 +680,56 @@ async def update_issue(
     if labels:
         fields["labels"] = labels
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            # Update issue fields
-            if fields:
-                response = await client.put(
-                    f"{base_url}/rest/api/3/issue/{issue_key}",
-                    auth=auth,
-                    json={"fields": fields}
-                )
-                response.raise_for_status()
+    client = get_jira_client()
+    try:
+        # Update issue fields
+        if fields:
+            response = await client.put(
+                f"{base_url}/rest/api/3/issue/{issue_key}",
+                auth=auth,
+                json={"fields": fields}
+            )
+            response.raise_for_status()
+        
+        # Handle status transition if provided
+        if status:
+            # First, get available transitions
+            transitions_response = await client.get(
+                f"{base_url}/rest/api/3/issue/{issue_key}/transitions",
+                auth=auth
+            )
+            transitions_response.raise_for_status()
+            transitions = transitions_response.json().get("transitions", [])
             
-            # Handle status transition if provided
-            if status:
-                # First, get available transitions
-                transitions_response = await client.get(
+            # Find matching transition
+            transition_id = None
+            for transition in transitions:
+                if transition["to"]["name"].lower() == status.lower():
+                    transition_id = transition["id"]
+                    break
+            
+            if transition_id:
+                await client.post(
                     f"{base_url}/rest/api/3/issue/{issue_key}/transitions",
-                    auth=auth
+                    auth=auth,
+                    json={"transition": {"id": transition_id}}
+                )
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Status transition to '{status}' not available. Available: {[t['to']['name'] for t in transitions]}"
                 )
-                transitions_response.raise_for_status()
-                transitions = transitions_response.json().get("transitions", [])
-                
-                # Find matching transition
-                transition_id = None
-                for transition in transitions:
-                    if transition["to"]["name"].lower() == status.lower():
-                        transition_id = transition["id"]
-                        break
-                
-                if transition_id:
-                    await client.post(
-                        f"{base_url}/rest/api/3/issue/{issue_key}/transitions",
-                        auth=auth,
-                        json={"transition": {"id": transition_id}}
-                    )
-                else:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Status transition to '{status}' not available. Available: {[t['to']['name'] for t in transitions]}"
-                    )
-            
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Jira API error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to connect to Jira: {str(e)}"
-            )
         
-        # Fetch updated issue details
-        return await get_single_issue(issue_key)
\ No newline at end of file
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Jira API error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Jira: {str(e)}"
+        )
+    
+    # Fetch updated issue details
+    return await get_single_issue(issue_key)
\ No newline at end of file
@@ -7,6 +7,7 @@ Processes trigger events by:
 3. Sending Slack notifications
 """
 
+import asyncio
 import logging
 from typing import Optional
 from app.triggers.models import TriggerEvent, ContextMismatch
@@ -15,7 +16,7 @@ from app.policy.scoring import (
     extract_task_context_from_jira
 )
 from app.policy.decision import decide_action
-from app.delegation.selector import select_teammate
+from app.delegation.selector import select_teammate, get_teammate_list
 from app.delegation.notifier import notify_teammate, DelegationNotification
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ async def process_trigger(event: TriggerEvent, mismatch: Optional[ContextMismatc
     """
     logger.info(f"Processing trigger: {event.trigger_type} for {event.event_data.get('task_key')}")
     
+    teammates_task = None
     try:
         # Get task context
         task_context = await _get_task_context(event)
@@ -39,6 +41,9 @@ async def process_trigger(event: TriggerEvent, mismatch: Optional[ContextMismatc
             logger.warning(f"Could not get task context for {event.event_data.get('task_key')}")
             return
         
+        # Warm the teammate list while availability is checked, in case we delegate
+        teammates_task = asyncio.create_task(get_teammate_list())
+        
         # Check user availability
         user_available = await _check_user_availability(event.event_data.get("user_id"))
         
@@ -47,8 +52,15 @@ async def process_trigger(event: TriggerEvent, mismatch: Optional[ContextMismatc
         
         logger.info(f"Policy decision: {decision.action.value} (CS: {decision.criticality_score:.1f})")
         
+        if decision.action.value != "delegate":
+            teammates_task.cancel()
+        
         # Execute action based on decision
         if decision.action.value == "delegate":
+            try:
+                await teammates_task
+            except Exception as e:
+                logger.warning(f"Teammate prefetch failed: {e}")
             await _execute_delegation(task_context, decision, event)
         elif decision.action.value == "reschedule":
             await _execute_reschedule(task_context, decision, event, mismatch)
@@ -61,6 +73,14 @@ async def process_trigger(event: TriggerEvent, mismatch: Optional[ContextMismatc
             
     except Exception as e:
         logger.error(f"Error processing trigger: {e}", exc_info=True)
+    finally:
+        # Don't leave the prefetch running (or its error unretrieved) if we
+        # bailed out before delegating
+        if teammates_task is not None:
+            if not teammates_task.done():
+                teammates_task.cancel()
+            elif not teammates_task.cancelled():
+                teammates_task.exception()
 
 
 async def _get_task_context(event: TriggerEvent):
@@ -86,11 +106,8 @@ async def _get_task_context(event: TriggerEvent):
                 })
             
             task_context = extract_task_context_from_pr(pr_data)
-            # Attach enhanced metadata
-            if hasattr(task_context, 'metadata'):
-                task_context.metadata.update(metadata)
-            else:
-                task_context.metadata = metadata
+            # Attach enhanced metadata (TaskContext is frozen; metadata is a dict)
+            task_context.metadata.update(metadata)
             
             return task_context
         
@@ -106,11 +123,8 @@ async def _get_task_context(event: TriggerEvent):
                 })
             
             task_context = extract_task_context_from_jira(issue_dict)
-            # Attach enhanced metadata
-            if hasattr(task_context, 'metadata'):
-                task_context.metadata.update(metadata)
-            else:
-                task_context.metadata = metadata
+            # Attach enhanced metadata (TaskContext is frozen; metadata is a dict)
+            task_context.metadata.update(metadata)
             
             return task_context
         
@@ -224,6 +238,7 @@ async def _execute_notify(task_context, decision, event: TriggerEvent, mismatch:
     try:
         import os
         import httpx
+        import orjson
         
         token = os.getenv("SLACK_BOT_TOKEN")
         if not token:
@@ -265,7 +280,7 @@ async def _execute_notify(task_context, decision, event: TriggerEvent, mismatch:
             response = await client.post(
                 "https://slack.com/api/chat.postMessage",
                 headers=headers,
-                json=payload
+                content=orjson.dumps(payload)
             )
             response.raise_for_status()
             result = response.json()
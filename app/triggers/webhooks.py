@@ -6,14 +6,17 @@ Receives events from external services and triggers processing.
 
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.triggers.models import TriggerEvent, TriggerType
 from app.triggers.processor import process_trigger
 
 logger = logging.getLogger(__name__)
 
+# "repository" webhook actions that change metadata returned by get_github_repo_tool
+_REPOSITORY_ACTIONS = {"edited", "renamed", "transferred", "publicized", "privatized"}
 
-async def handle_github_webhook(payload: Dict[str, Any]) -> bool:
+
+async def handle_github_webhook(payload: Dict[str, Any], event_name: Optional[str] = None) -> bool:
     """
     Handle GitHub webhook events.
     
@@ -23,11 +26,22 @@ async def handle_github_webhook(payload: Dict[str, Any]) -> bool:
     - pull_request.labeled (priority change)
     - pull_request.assigned
     - pull_request.review_requested
+    - repository.edited/renamed/... (invalidates cached repo metadata)
+    
+    Args:
+        payload: Webhook payload
+        event_name: X-GitHub-Event header; actions like "edited" are shared by
+            many event types, so repository events are identified by it alone
     """
     event_type = payload.get("action")
     pr_data = payload.get("pull_request", {})
     
     if not pr_data:
+        if event_name == "repository" and event_type in _REPOSITORY_ACTIONS:
+            # Repository settings changed - drop cached repo metadata
+            from app.agno_tools.cache import invalidate_tool_cache
+            invalidate_tool_cache("get_github_repo_tool")
+            logger.info(f"GitHub webhook: repository {event_type}, repo cache invalidated")
         return False
     
     pr_number = pr_data.get("number")